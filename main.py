@@ -2,26 +2,49 @@
 
 import os
 import sys
-import argparse
+import time
+import asyncio
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
 import yaml
 
-from translatex import DocxTranslator
-from translatex.batch import BatchProcessor
-from translatex.docs.translator import DocsTranslator
 from translatex.utils.file_logger import setup_logger, get_logger
+from translatex.utils.rate_limiter import AsyncRateLimiter
 from translatex.utils.console import (
     console, print_banner, print_config, print_success, print_error,
     print_warning, print_info, print_summary, print_file_result,
     create_progress, print_docs_header, print_docx_header
 )
 
+# python-docx, openai and the glossary/cache stack are imported where used,
+# so --help and docs-only runs don't load them
+if TYPE_CHECKING:
+    from translatex import DocxTranslator
+    from translatex.utils.cache import TranslationCache
+    from translatex.utils.glossary import GlossaryLoader
+
+
+# libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Config field holding the API key for each provider (None = no key needed)
+_KEY_MAP = {
+    "openai": "openai_api_key",
+    "openrouter": "openrouter_api_key",
+    "groq": "groq_api_key",
+    "gemini": "gemini_api_key",
+    "ollama": None,  # Ollama local doesn't need API key
+    "ollama-cloud": "ollama_api_key",
+    "deepseek": "deepseek_api_key",
+}
+
 
 def load_config(config_path: str) -> dict:
     """Load config from YAML file"""
     try:
         with open(config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
-        return config
+            return yaml.load(f, Loader=_YAML_LOADER)
     except FileNotFoundError:
         print_error(f"Config file not found: {config_path}")
         raise
@@ -30,8 +53,70 @@ def load_config(config_path: str) -> dict:
         raise
 
 
-def create_translator(config: dict, input_file: str, output_dir: str) -> DocxTranslator:
+def make_progress_describer(progress, task, total: int):
+    """Return a callback that shows the current filename at most ~10 times/s
+    
+    Large runs (over 100 files) skip the description and show only count/ETA.
+    """
+    if total > 100:
+        return lambda filename: None
+    
+    last_update = 0.0
+    
+    def describe(filename: str):
+        nonlocal last_update
+        now = time.monotonic()
+        if now - last_update > 0.1:
+            progress.update(task, description=f"[cyan]{filename[:40]}[/cyan]")
+            last_update = now
+    
+    return describe
+
+
+def create_rate_limiter(config: dict) -> AsyncRateLimiter:
+    """Create the process-wide rate limiter for the configured model"""
+    from translatex.utils.llm_client_factory import LLMClientFactory
+    
+    rpm = config.get("requests_per_minute")
+    if not rpm:
+        rpm = LLMClientFactory.get_rate_limit_config(config.get("model", "gpt-4o-mini"))["rpm"]
+    return AsyncRateLimiter(rpm / 60)
+
+
+@dataclass
+class SharedContext:
+    """Resources built once per run and reused by every DocxTranslator"""
+    client: Any
+    glossary: "GlossaryLoader"
+    cache: "TranslationCache"
+    rate_limiter: AsyncRateLimiter
+
+
+def build_shared_context(config: dict, output_dir: str) -> SharedContext:
+    """Build the LLM client, glossary, cache and rate limiter once"""
+    from translatex.utils.cache import TranslationCache
+    from translatex.utils.glossary import GlossaryLoader
+    from translatex.utils.llm_client_factory import LLMClientFactory
+    
+    provider = config.get("provider", "openai")
+    key_field = _KEY_MAP.get(provider)
+    api_key = config.get(key_field, "") if key_field else ""
+    
+    return SharedContext(
+        client=LLMClientFactory.create_client(provider, api_key),
+        glossary=GlossaryLoader(glossary_file=config.get("glossary_file")),
+        cache=TranslationCache(
+            cache_file=os.path.join(output_dir, ".translatex_cache.json"),
+            enabled=config.get("cache_enabled", True)
+        ),
+        rate_limiter=create_rate_limiter(config),
+    )
+
+
+def create_translator(config: dict, input_file: str, output_dir: str, shared: SharedContext = None) -> "DocxTranslator":
     """Create a DocxTranslator instance from config"""
+    from translatex import DocxTranslator
+    
     return DocxTranslator(
         input_file=input_file,
         output_dir=output_dir,
@@ -52,10 +137,14 @@ def create_translator(config: dict, input_file: str, output_dir: str) -> DocxTra
         glossary_file=config.get("glossary_file"),
         review_mode=config.get("review_mode", False),
         auto_resume=config.get("auto_resume", True),
+        rate_limiter=shared.rate_limiter if shared else None,
+        client=shared.client if shared else None,
+        glossary_loader=shared.glossary if shared else None,
+        cache=shared.cache if shared else None,
     )
 
 
-def translate_single_file(config: dict, input_file: str, output_dir: str):
+def translate_single_file(config: dict, input_file: str, output_dir: str, shared: SharedContext = None):
     """Translate a single DOCX file"""
     logger = get_logger()
     
@@ -70,7 +159,7 @@ def translate_single_file(config: dict, input_file: str, output_dir: str):
     )
     
     try:
-        translator = create_translator(config, input_file, output_dir)
+        translator = create_translator(config, input_file, output_dir, shared)
         translator.translate()
         
         output_path = translator.get_output_path()
@@ -91,8 +180,10 @@ def translate_single_file(config: dict, input_file: str, output_dir: str):
         sys.exit(1)
 
 
-def translate_batch(config: dict, input_dir: str, output_dir: str):
-    """Translate multiple DOCX files in a directory"""
+async def translate_batch(config: dict, input_dir: str, output_dir: str, shared: SharedContext = None):
+    """Translate multiple DOCX files in a directory concurrently"""
+    from translatex.batch import BatchProcessor
+    
     logger = get_logger()
     
     processor = BatchProcessor(translator_factory=lambda: None)
@@ -116,63 +207,61 @@ def translate_batch(config: dict, input_dir: str, output_dir: str):
         target_lang=config.get("target_lang", "Vietnamese")
     )
     
-    results = {}
+    success_count = 0
+    failed_files = []
+    # Files are I/O-bound on LLM calls, so overlap them up to batch_concurrency
+    semaphore = asyncio.Semaphore(max(1, config.get("batch_concurrency", 2)))
+    
+    # Weight progress by file size so large documents don't skew the ETA
+    sizes = {file_path: max(os.path.getsize(file_path), 1) for file_path in files}
     
     with create_progress() as progress:
-        task = progress.add_task("Translating files...", total=len(files))
+        task = progress.add_task("Translating files...", total=sum(sizes.values()))
+        describe = make_progress_describer(progress, task, len(files))
         
-        for file_path in files:
+        async def _one(file_path: str):
             filename = os.path.basename(file_path)
-            progress.update(task, description=f"[cyan]{filename[:40]}[/cyan]")
-            
-            try:
-                translator = create_translator(config, file_path, output_dir)
-                translator.translate()
-                results[file_path] = {"status": "success", "output": translator.get_output_path()}
-            except Exception as e:
-                results[file_path] = {"status": "failed", "error": str(e)}
-                logger.error(f"Failed to translate {filename}: {e}")
-            
-            progress.advance(task)
-    
-    # Print results
-    console.print()
-    for path, result in results.items():
-        filename = os.path.basename(path)
-        print_file_result(filename, result["status"], result.get("output"), result.get("error"))
+            async with semaphore:
+                describe(filename)
+                
+                try:
+                    translator = await asyncio.to_thread(create_translator, config, file_path, output_dir, shared)
+                    return file_path, await translator.atranslate(), None
+                except Exception as e:
+                    logger.error(f"Failed to translate {filename}: {e}")
+                    return file_path, None, str(e)
+        
+        # Report each file as soon as it finishes instead of collecting all results
+        for next_done in asyncio.as_completed([_one(file_path) for file_path in files]):
+            file_path, output, error = await next_done
+            filename = os.path.basename(file_path)
+            if error is None:
+                success_count += 1
+                print_file_result(filename, "success", output)
+            else:
+                failed_files.append(filename)
+                print_file_result(filename, "failed", error=error)
+            progress.advance(task, sizes[file_path])
     
     # Print summary
-    success_count = sum(1 for r in results.values() if r["status"] == "success")
-    failed_count = sum(1 for r in results.values() if r["status"] == "failed")
-    
     console.print()
     print_summary("Batch Translation Complete", {
         "Total files": len(files),
         "Translated": success_count,
-        "Failed": failed_count,
+        "Failed": len(failed_files),
     })
 
 
 def translate_docs(config: dict, source_dir: str, output_dir: str, force: bool = False):
     """Translate documentation directory (Markdown/MDX files)"""
+    from translatex.docs.translator import DocsTranslator
+    
     logger = get_logger()
     
     provider = config.get("provider", "openai")
-    key_map = {
-        "openai": "openai_api_key",
-        "openrouter": "openrouter_api_key",
-        "groq": "groq_api_key",
-        "gemini": "gemini_api_key",
-        "ollama": None,
-        "ollama-cloud": "ollama_api_key",
-        "deepseek": "deepseek_api_key",
-    }
     # Ollama local doesn't need API key
-    if provider == "ollama":
-        api_key = ""
-    else:
-        key_field = key_map.get(provider, "openai_api_key")
-        api_key = config.get(key_field, "") if key_field else ""
+    key_field = _KEY_MAP.get(provider, "openai_api_key")
+    api_key = config.get(key_field, "") if key_field else ""
     
     print_config(
         provider=provider,
@@ -223,12 +312,19 @@ def translate_docs(config: dict, source_dir: str, output_dir: str, force: bool =
                 manifest.load()
             manifest.set_directories(source_dir, output_dir)
             
+            # Hash sources up front in parallel
+            changed = {}
+            if not force:
+                changed = manifest.batch_is_changed(
+                    (doc_file.relative_path, doc_file.source_path) for doc_file in files
+                )
+            
+            describe = make_progress_describer(progress, task, len(files))
             for doc_file in files:
-                filename = Path(doc_file.source_path).name
-                progress.update(task, description=f"[cyan]{filename[:40]}[/cyan]")
+                describe(Path(doc_file.source_path).name)
                 
                 # Check if file needs translation
-                if not force and not manifest.is_changed(doc_file.relative_path, doc_file.source_path):
+                if not force and not changed[doc_file.relative_path]:
                     stats["files_cached"] += 1
                     progress.advance(task)
                     continue
@@ -236,7 +332,9 @@ def translate_docs(config: dict, source_dir: str, output_dir: str, force: bool =
                 try:
                     result = translator.translate_file(doc_file.source_path, doc_file.output_path)
                     if result:
-                        manifest.update(doc_file.relative_path, doc_file.source_hash, doc_file.output_path)
+                        manifest.update(
+                            doc_file.relative_path, doc_file.source_hash, doc_file.output_path, doc_file.source_stat
+                        )
                         stats["files_translated"] += 1
                     else:
                         stats["files_failed"] += 1
@@ -265,6 +363,8 @@ def translate_docs(config: dict, source_dir: str, output_dir: str, force: bool =
 
 
 def main():
+    import argparse
+    
     print_banner()
     
     config = load_config("config.yaml")
@@ -290,23 +390,10 @@ Examples:
     
     # Validate provider API key (Ollama local doesn't need API key)
     provider = config.get("provider", "openai")
-    key_map = {
-        "openai": "openai_api_key",
-        "openrouter": "openrouter_api_key",
-        "groq": "groq_api_key",
-        "gemini": "gemini_api_key",
-        "ollama": None,  # Ollama local doesn't need API key
-        "ollama-cloud": "ollama_api_key",
-        "deepseek": "deepseek_api_key",
-    }
-    
-    if provider != "ollama":
-        key_field = key_map.get(provider)
-        if key_field:
-            api_key = config.get(key_field, "")
-            if not api_key:
-                print_error(f"API key not found for provider '{provider}'. Please set '{key_field}' in config.yaml.")
-                sys.exit(1)
+    key_field = _KEY_MAP.get(provider)
+    if key_field and not config.get(key_field, ""):
+        print_error(f"API key not found for provider '{provider}'. Please set '{key_field}' in config.yaml.")
+        sys.exit(1)
     
     os.makedirs(output_dir, exist_ok=True)
     
@@ -330,16 +417,23 @@ Examples:
         parser.print_help()
         sys.exit(1)
     
+    # Client, glossary, cache and rate limiter are shared by every file in the run
+    try:
+        shared = build_shared_context(config, output_dir)
+    except Exception as e:
+        print_error(f"Failed to initialize translator: {e}")
+        sys.exit(1)
+    
     if os.path.isdir(input_path):
         if not config.get("batch_enabled", True):
             print_error("Batch processing is disabled. Set 'batch_enabled: true' in config.")
             sys.exit(1)
-        translate_batch(config, input_path, output_dir)
+        asyncio.run(translate_batch(config, input_path, output_dir, shared))
     elif os.path.isfile(input_path):
         if not input_path.lower().endswith('.docx'):
             print_error("Input file must be a .docx file")
             sys.exit(1)
-        translate_single_file(config, input_path, output_dir)
+        translate_single_file(config, input_path, output_dir, shared)
     else:
         print_error(f"Input not found: {input_path}")
         sys.exit(1)
@@ -0,0 +1,106 @@
+"""Shared pytest fixtures."""
+
+import os
+import functools
+
+import pytest
+from hypothesis import HealthCheck, Phase, settings
+from hypothesis.database import DirectoryBasedExampleDatabase
+
+from translatex.docs.markdown_parser import MarkdownParser
+from translatex.docs.mdx_parser import MDXParser
+
+
+# One Hypothesis profile for the whole suite instead of per-test @settings.
+# derandomize: fixed seed per test; database=None: no on-disk example store.
+settings.register_profile(
+    "fast",
+    max_examples=25,
+    derandomize=True,
+    database=None,
+    deadline=None,
+    suppress_health_check=[HealthCheck.function_scoped_fixture, HealthCheck.too_slow],
+)
+# CI: replay stored failures first, then generate. Shrinking only runs on a
+# failure, so green runs don't pay for it. Cache HYPOTHESIS_DB_DIR between
+# runs, keyed on the test sources (e.g. hashFiles('tests/**/*.py')).
+settings.register_profile(
+    "ci",
+    parent=settings.get_profile("fast"),
+    derandomize=False,
+    # One subdirectory per pytest-xdist worker so workers never share DB files
+    database=DirectoryBasedExampleDatabase(os.path.join(
+        os.environ.get("HYPOTHESIS_DB_DIR", ".hypothesis/examples"),
+        os.environ.get("PYTEST_XDIST_WORKER", "main"),
+    )),
+    phases=[Phase.explicit, Phase.reuse, Phase.generate, Phase.shrink],
+)
+# Opt-in deeper run: HYPOTHESIS_PROFILE=thorough pytest
+settings.register_profile("thorough", parent=settings.get_profile("fast"), max_examples=500, derandomize=False)
+settings.load_profile(
+    os.environ.get("HYPOTHESIS_PROFILE", "ci" if os.environ.get("CI") else "fast")
+)
+
+
+@pytest.fixture(scope="session")
+def dummy_docx(tmp_path_factory):
+    """A single empty .docx path shared by tests that mock out python-docx."""
+    path = tmp_path_factory.mktemp("docx") / "dummy.docx"
+    path.touch()
+    return str(path)
+
+
+class _StubAsyncOpenAI:
+    """Records constructor arguments without building an httpx client."""
+    
+    def __init__(self, *, api_key, base_url=None, **kwargs):
+        self.api_key = api_key
+        self.base_url = base_url
+
+
+@pytest.fixture
+def lightweight_openai(monkeypatch):
+    """Replace AsyncOpenAI in the client factory for tests that only inspect config."""
+    monkeypatch.setattr("translatex.utils.llm_client_factory.AsyncOpenAI", _StubAsyncOpenAI)
+    return _StubAsyncOpenAI
+
+
+@pytest.fixture(scope="module")
+def module_lightweight_openai():
+    """lightweight_openai for module-scoped fixtures that build clients."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("translatex.utils.llm_client_factory.AsyncOpenAI", _StubAsyncOpenAI)
+        yield _StubAsyncOpenAI
+
+
+@pytest.fixture(scope="session")
+def md_parser():
+    """Shared MarkdownParser; parsing keeps no per-call state on the instance."""
+    return MarkdownParser()
+
+
+@pytest.fixture(scope="session")
+def mdx_parser():
+    """Shared MDXParser; parsing keeps no per-call state on the instance."""
+    return MDXParser()
+
+
+@pytest.fixture(scope="session")
+def md_round_trip(md_parser):
+    """parse + reconstruct with MarkdownParser, memoized on the content.
+    
+    Only valid while parsing is pure; drop the cache if the parser gains state.
+    """
+    @functools.lru_cache(maxsize=4096)
+    def round_trip(content: str) -> str:
+        return md_parser.reconstruct(md_parser.parse(content))
+    return round_trip
+
+
+@pytest.fixture(scope="session")
+def mdx_round_trip(mdx_parser):
+    """parse + reconstruct with MDXParser, memoized on the content."""
+    @functools.lru_cache(maxsize=4096)
+    def round_trip(content: str) -> str:
+        return mdx_parser.reconstruct(mdx_parser.parse(content))
+    return round_trip
@@ -3,11 +3,30 @@
 import os
 import tempfile
 from pathlib import Path
-from hypothesis import given, strategies as st, settings
+
+import pytest
+from hypothesis import given, strategies as st
 
 from translatex.batch import BatchProcessor
 
 
+@pytest.fixture(scope="module")
+def batch_tmp_root(tmp_path_factory):
+    """One temp root per module; each example works in its own subdirectory.
+    
+    Cleanup is left to pytest's tmp_path retention (one bulk removal).
+    """
+    return str(tmp_path_factory.mktemp("batch"))
+
+
+def _create_files(directory, names):
+    """Create empty files without the Path.touch() wrapper overhead."""
+    paths = [os.path.join(directory, name) for name in names]
+    for path in paths:
+        os.close(os.open(path, os.O_CREAT | os.O_WRONLY, 0o644))
+    return paths
+
+
 class TestBatchFileDiscoveryProperty:
     """Property-based tests for batch file discovery.
     
@@ -19,35 +38,31 @@ class TestBatchFileDiscoveryProperty:
         docx_count=st.integers(min_value=0, max_value=10),
         other_count=st.integers(min_value=0, max_value=10)
     )
-    @settings(max_examples=100)
-    def test_finds_exactly_docx_files(self, docx_count, other_count):
+    def test_finds_exactly_docx_files(self, batch_tmp_root, docx_count, other_count):
         """For any directory, BatchProcessor SHALL return exactly the .docx files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create .docx files
-            docx_files = []
-            for i in range(docx_count):
-                path = Path(tmpdir) / f"document_{i}.docx"
-                path.touch()
-                docx_files.append(str(path))
-            
-            # Create other files
-            other_extensions = [".pdf", ".txt", ".doc", ".xlsx", ".pptx"]
-            for i in range(other_count):
-                ext = other_extensions[i % len(other_extensions)]
-                path = Path(tmpdir) / f"other_{i}{ext}"
-                path.touch()
-            
-            # Find files
-            processor = BatchProcessor(translator_factory=lambda: None)
-            found = processor.find_docx_files(tmpdir)
-            
-            # Verify count
-            assert len(found) == docx_count, \
-                f"Expected {docx_count} .docx files, found {len(found)}"
-            
-            # Verify all found files are .docx
-            for f in found:
-                assert f.endswith(".docx"), f"Non-docx file found: {f}"
+        tmpdir = tempfile.mkdtemp(dir=batch_tmp_root)
+        
+        # Create .docx files
+        _create_files(tmpdir, [f"document_{i}.docx" for i in range(docx_count)])
+        
+        # Create other files
+        other_extensions = [".pdf", ".txt", ".doc", ".xlsx", ".pptx"]
+        _create_files(tmpdir, [
+            f"other_{i}{other_extensions[i % len(other_extensions)]}"
+            for i in range(other_count)
+        ])
+        
+        # Find files
+        processor = BatchProcessor(translator_factory=lambda: None)
+        found = processor.find_docx_files(tmpdir)
+        
+        # Verify count
+        assert len(found) == docx_count, \
+            f"Expected {docx_count} .docx files, found {len(found)}"
+        
+        # Verify all found files are .docx
+        for f in found:
+            assert f.endswith(".docx"), f"Non-docx file found: {f}"
     
     @given(filenames=st.lists(
         st.text(alphabet="abcdefghijklmnopqrstuvwxyz0123456789_", min_size=1, max_size=20),
@@ -55,45 +70,37 @@ class TestBatchFileDiscoveryProperty:
         max_size=10,
         unique=True
     ))
-    @settings(max_examples=100)
-    def test_finds_all_docx_regardless_of_name(self, filenames):
+    def test_finds_all_docx_regardless_of_name(self, batch_tmp_root, filenames):
         """All .docx files should be found regardless of filename."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create files with various names
-            created = []
-            for name in filenames:
-                path = Path(tmpdir) / f"{name}.docx"
-                path.touch()
-                created.append(str(path))
-            
-            processor = BatchProcessor(translator_factory=lambda: None)
-            found = processor.find_docx_files(tmpdir)
-            
-            assert len(found) == len(created), \
-                f"Expected {len(created)} files, found {len(found)}"
+        tmpdir = tempfile.mkdtemp(dir=batch_tmp_root)
+        
+        # Create files with various names
+        created = _create_files(tmpdir, [f"{name}.docx" for name in filenames])
+        
+        processor = BatchProcessor(translator_factory=lambda: None)
+        found = processor.find_docx_files(tmpdir)
+        
+        assert len(found) == len(created), \
+            f"Expected {len(created)} files, found {len(found)}"
     
     @given(docx_count=st.integers(min_value=1, max_value=5))
-    @settings(max_examples=100)
-    def test_excludes_temp_files(self, docx_count):
+    def test_excludes_temp_files(self, batch_tmp_root, docx_count):
         """Temp files starting with ~$ should be excluded."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create normal .docx files
-            for i in range(docx_count):
-                path = Path(tmpdir) / f"document_{i}.docx"
-                path.touch()
-            
-            # Create temp files (Word creates these)
-            for i in range(3):
-                path = Path(tmpdir) / f"~$document_{i}.docx"
-                path.touch()
-            
-            processor = BatchProcessor(translator_factory=lambda: None)
-            found = processor.find_docx_files(tmpdir)
-            
-            # Should only find normal files
-            assert len(found) == docx_count
-            for f in found:
-                assert not Path(f).name.startswith("~$")
+        tmpdir = tempfile.mkdtemp(dir=batch_tmp_root)
+        
+        # Create normal .docx files
+        _create_files(tmpdir, [f"document_{i}.docx" for i in range(docx_count)])
+        
+        # Create temp files (Word creates these)
+        _create_files(tmpdir, [f"~$document_{i}.docx" for i in range(3)])
+        
+        processor = BatchProcessor(translator_factory=lambda: None)
+        found = processor.find_docx_files(tmpdir)
+        
+        # Should only find normal files
+        assert len(found) == docx_count
+        for f in found:
+            assert not Path(f).name.startswith("~$")
 
 
 class TestBatchProcessorUnit:
@@ -106,6 +113,19 @@ class TestBatchProcessorUnit:
             found = processor.find_docx_files(tmpdir)
             assert found == []
     
+    def test_skips_directories_and_hidden_files(self):
+        """Directories named *.docx and hidden .docx files should be skipped."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            os.mkdir(os.path.join(tmpdir, "folder.docx"))
+            for name in ("a.docx", ".hidden.docx"):
+                with open(os.path.join(tmpdir, name), "w") as f:
+                    f.write("test")
+            
+            processor = BatchProcessor(translator_factory=lambda: None)
+            found = processor.find_docx_files(tmpdir)
+            
+            assert found == [os.path.join(tmpdir, "a.docx")]
+    
     def test_nonexistent_directory_raises(self):
         """Non-existent directory should raise BatchError."""
         from translatex.utils.exceptions import BatchError
@@ -152,3 +172,22 @@ class TestBatchProcessorUnit:
         assert summary["total"] == 3
         assert summary["success_count"] == 2
         assert summary["failed_count"] == 1
+    
+    def test_process_keeps_order_and_captures_failures(self):
+        """Results follow the input order; a failing file doesn't stop the batch."""
+        class FakeTranslator:
+            def translate(self, file_path, output_dir):
+                if "bad" in file_path:
+                    raise RuntimeError("API error")
+                return file_path + ".out"
+        
+        files = ["a.docx", "bad.docx", "c.docx", "d.docx"]
+        progress = []
+        results = BatchProcessor(translator_factory=FakeTranslator).process(
+            files, on_progress=lambda current, total, name: progress.append(current)
+        )
+        
+        assert list(results) == files
+        assert results["a.docx"].output_file == "a.docx.out"
+        assert results["bad.docx"].error == "API error"
+        assert progress == [1, 2, 3, 4]
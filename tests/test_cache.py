@@ -1,8 +1,10 @@
 """Tests for TranslationCache - Properties 4 & 5."""
 
 import os
+import json
+import hashlib
 import tempfile
-from hypothesis import given, strategies as st, settings
+from hypothesis import given, strategies as st
 
 from translatex.utils.cache import TranslationCache
 
@@ -15,7 +17,6 @@ class TestCacheHashProperty:
     """
     
     @given(text=st.text(min_size=1, max_size=1000))
-    @settings(max_examples=100)
     def test_hash_consistency(self, text):
         """For any source text, cache lookup SHALL use consistent hash as key."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -31,7 +32,6 @@ class TestCacheHashProperty:
         text1=st.text(min_size=1, max_size=100),
         text2=st.text(min_size=1, max_size=100)
     )
-    @settings(max_examples=100)
     def test_different_texts_different_hashes(self, text1, text2):
         """Different texts should produce different hashes (with high probability)."""
         if text1 == text2:
@@ -49,7 +49,6 @@ class TestCacheHashProperty:
         source=st.text(min_size=1, max_size=100),
         translated=st.text(min_size=1, max_size=100)
     )
-    @settings(max_examples=100)
     def test_cache_roundtrip(self, source, translated):
         """For any text, set then get should return the same translation."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -72,7 +71,6 @@ class TestCacheHitProperty:
         source=st.text(min_size=1, max_size=100),
         translated=st.text(min_size=1, max_size=100)
     )
-    @settings(max_examples=100)
     def test_cache_hit_returns_cached_value(self, source, translated):
         """For any cached translation, get SHALL return cached value without needing API."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -125,3 +123,92 @@ class TestCacheUnit:
             cache.clear()
             assert cache.size() == 0
             assert cache.get("hello") is None
+    
+    def test_cache_lookup_through_index(self):
+        """Entries folded into the sorted index should still be found after reload."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_file = os.path.join(tmpdir, "cache.json")
+            cache = TranslationCache(cache_file=cache_file, enabled=True)
+            cache.REINDEX_TAIL = 4
+            
+            for i in range(10):
+                cache.set(f"source {i}", f"translated {i}")
+            cache.set("source 2", "updated 2")
+            
+            reloaded = TranslationCache(cache_file=cache_file, enabled=True)
+            assert reloaded.size() == 10
+            assert reloaded.get("source 2") == "updated 2"
+            assert reloaded.get("source 9") == "translated 9"
+            assert reloaded.get("missing") is None
+    
+    def test_torn_record_is_dropped(self):
+        """A partial record at the end of the data file should be ignored."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_file = os.path.join(tmpdir, "cache.json")
+            cache = TranslationCache(cache_file=cache_file, enabled=True)
+            cache.set("hello", "xin chao")
+            
+            with open(cache.data_file, "ab") as f:
+                f.write(b"\x01\x02\x03")
+            
+            reloaded = TranslationCache(cache_file=cache_file, enabled=True)
+            assert reloaded.get("hello") == "xin chao"
+            reloaded.set("bye", "tam biet")
+            assert TranslationCache(cache_file=cache_file, enabled=True).get("bye") == "tam biet"
+    
+    def test_hash_collision_is_a_miss(self, monkeypatch):
+        """A different source text with the same key must not get the cached translation."""
+        monkeypatch.setattr(TranslationCache, "_hash", lambda self, text: 42)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_file = os.path.join(tmpdir, "cache.json")
+            cache = TranslationCache(cache_file=cache_file, enabled=True)
+            cache.set("hello", "xin chao")
+            assert cache.get("hello") == "xin chao"
+            assert cache.get("goodbye") is None
+            
+            # Same check for entries read from the index
+            cache._reindex()
+            reloaded = TranslationCache(cache_file=cache_file, enabled=True)
+            assert reloaded.get("hello") == "xin chao"
+            assert reloaded.get("goodbye") is None
+    
+    def test_legacy_json_cache_imported(self):
+        """A SHA-256 keyed JSON cache should be re-keyed into the new store once."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_file = os.path.join(tmpdir, "cache.json")
+            legacy = {
+                hashlib.sha256(source.encode("utf-8")).hexdigest(): {
+                    "source": source,
+                    "translated": translated,
+                    "timestamp": "2025-01-01T00:00:00",
+                }
+                for source, translated in [("hello", "xin chao"), ("bye", "tam biet")]
+            }
+            with open(cache_file, "w", encoding="utf-8") as f:
+                json.dump(legacy, f, ensure_ascii=False, indent=2)
+            
+            cache = TranslationCache(cache_file=cache_file, enabled=True)
+            assert cache.size() == 2
+            assert cache.get("hello") == "xin chao"
+            assert not os.path.exists(cache_file)
+            
+            reloaded = TranslationCache(cache_file=cache_file, enabled=True)
+            assert reloaded.get("bye") == "tam biet"
+    
+    def test_bloom_prefilter_grows_with_entries(self):
+        """The Bloom filter should be sized from the entry count and never hide an entry."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_file = os.path.join(tmpdir, "cache.json")
+            cache = TranslationCache(cache_file=cache_file, enabled=True)
+            cache.BLOOM_MIN_ENTRIES = 8
+            
+            for i in range(8):
+                cache.set(f"source {i}", f"translated {i}")
+            small = len(cache._bloom)
+            for i in range(8, 40):
+                cache.set(f"source {i}", f"translated {i}")
+            
+            assert len(cache._bloom) * 8 >= cache.size() * cache.BLOOM_BITS_PER_KEY
+            assert len(cache._bloom) > small
+            assert all(cache.get(f"source {i}") == f"translated {i}" for i in range(40))
+            assert cache.get("missing") is None
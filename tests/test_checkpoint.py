@@ -1,8 +1,9 @@
 """Tests for CheckpointManager - Properties 1 & 2."""
 
 import os
+import sqlite3
 import tempfile
-from hypothesis import given, strategies as st, settings
+from hypothesis import given, strategies as st
 
 from translatex.utils.checkpoint import CheckpointManager
 
@@ -18,7 +19,6 @@ class TestCheckpointSaveProperty:
         segments=st.lists(st.text(min_size=1, max_size=50), min_size=1, max_size=20),
         translated_ratio=st.floats(min_value=0.0, max_value=1.0)
     )
-    @settings(max_examples=100)
     def test_checkpoint_saves_all_translated_segments(self, segments, translated_ratio):
         """For any interrupted translation, checkpoint SHALL contain all translated segments."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -53,7 +53,6 @@ class TestResumeSkipsProperty:
         total_segments=st.integers(min_value=5, max_value=50),
         completed_count=st.integers(min_value=1, max_value=4)
     )
-    @settings(max_examples=100)
     def test_resume_identifies_untranslated_segments(self, total_segments, completed_count):
         """For any resume operation, only untranslated segments SHALL be identified for processing."""
         completed_count = min(completed_count, total_segments - 1)
@@ -151,3 +150,86 @@ class TestCheckpointUnit:
             manager.save(segments1, {0}, {0: "t1"})
             
             assert not manager.validate(segments2)
+    
+    def test_incremental_updates_merged_on_load(self):
+        """save_incremental() rows should be merged with the saved snapshot."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            checkpoint_file = os.path.join(tmpdir, "checkpoint.db")
+            manager = CheckpointManager(checkpoint_file)
+            
+            manager.save(["seg1", "seg2", "seg3"], {0}, {0: "t1"})
+            manager.save_incremental(1, "t2")
+            manager.save_incremental(2, "t3")
+            
+            loaded_indices, loaded_translations = CheckpointManager(checkpoint_file).load()
+            assert loaded_indices == {0, 1, 2}
+            assert loaded_translations == {0: "t1", 1: "t2", 2: "t3"}
+    
+    def test_save_replaces_incremental_rows(self):
+        """save() should replace previously recorded rows with the snapshot."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            checkpoint_file = os.path.join(tmpdir, "checkpoint.db")
+            manager = CheckpointManager(checkpoint_file)
+            
+            manager.save_incremental(0, "old")
+            manager.save_incremental(5, "stale")
+            
+            manager.save(["seg1"], {0}, {0: "t1"})
+            assert manager.load() == ({0}, {0: "t1"})
+    
+    def test_clear_removes_wal_files(self):
+        """clear() should remove the database and its WAL side files."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            checkpoint_file = os.path.join(tmpdir, "checkpoint.db")
+            manager = CheckpointManager(checkpoint_file)
+            
+            manager.save(["seg1"], {0}, {0: "t1"})
+            manager.clear()
+            assert os.listdir(tmpdir) == []
+    
+    def test_duplicate_translations_stored_once(self):
+        """Identical translations should share one content row and one string."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            checkpoint_file = os.path.join(tmpdir, "checkpoint.db")
+            manager = CheckpointManager(checkpoint_file)
+            
+            manager.save(["a", "b", "c"], {0, 1, 2}, {0: "same", 1: "same", 2: "other"})
+            
+            (count,) = manager._connect().execute("SELECT COUNT(*) FROM contents").fetchone()
+            assert count == 2
+            
+            _, loaded_translations = CheckpointManager(checkpoint_file).load()
+            assert loaded_translations[0] is loaded_translations[1]
+    
+    def test_hash_collision_keeps_both_translations(self, monkeypatch):
+        """Different translations with the same content hash must not be merged."""
+        monkeypatch.setattr(CheckpointManager, "_content_hash", staticmethod(lambda text: 7))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            checkpoint_file = os.path.join(tmpdir, "checkpoint.db")
+            manager = CheckpointManager(checkpoint_file)
+            
+            manager.save(["a", "b", "c"], {0, 1}, {0: "first", 1: "second"})
+            manager.save_incremental(2, "third")
+            manager.save_incremental(3, "first")
+            
+            _, loaded_translations = CheckpointManager(checkpoint_file).load()
+            assert loaded_translations == {0: "first", 1: "second", 2: "third", 3: "first"}
+            assert loaded_translations[0] is loaded_translations[3]
+    
+    def test_old_schema_is_discarded(self):
+        """A checkpoint from the hash-keyed layout should be dropped, not crash."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            checkpoint_file = os.path.join(tmpdir, "checkpoint.db")
+            conn = sqlite3.connect(checkpoint_file)
+            conn.executescript(
+                "CREATE TABLE contents (hash INTEGER PRIMARY KEY, text TEXT NOT NULL);"
+                "CREATE TABLE translations (idx INTEGER PRIMARY KEY, content_hash INTEGER);"
+                "INSERT INTO contents VALUES (1, 'old'); INSERT INTO translations VALUES (0, 1);"
+            )
+            conn.close()
+            
+            manager = CheckpointManager(checkpoint_file)
+            assert manager.load() == (set(), {})
+            assert not manager.validate(["seg1"])
+            manager.save_incremental(0, "new")
+            assert manager.load() == ({0}, {0: "new"})
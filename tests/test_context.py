@@ -1,6 +1,6 @@
 """Tests for ContextWindow - Property 6."""
 
-from hypothesis import given, strategies as st, settings
+from hypothesis import given, strategies as st
 
 from translatex.utils.context import ContextWindow
 
@@ -16,7 +16,6 @@ class TestContextWindowProperty:
         window_size=st.integers(min_value=1, max_value=10),
         segments=st.lists(st.text(min_size=1, max_size=50), min_size=1, max_size=20)
     )
-    @settings(max_examples=100)
     def test_context_window_includes_n_segments(self, window_size, segments):
         """For any context_window=N config, exactly N previous segments SHALL be included."""
         context = ContextWindow(window_size=window_size)
@@ -40,7 +39,6 @@ class TestContextWindowProperty:
                 "Context should contain most recent N segments"
     
     @given(segments=st.lists(st.text(min_size=1, max_size=50), min_size=1, max_size=10))
-    @settings(max_examples=100)
     def test_zero_window_returns_empty(self, segments):
         """For context_window=0, no context SHALL be included."""
         context = ContextWindow(window_size=0)
@@ -56,7 +54,6 @@ class TestContextWindowProperty:
         window_size=st.integers(min_value=1, max_value=5),
         segment=st.text(min_size=1, max_size=50)
     )
-    @settings(max_examples=100)
     def test_context_contains_added_segment(self, window_size, segment):
         """Added segment should appear in context."""
         context = ContextWindow(window_size=window_size)
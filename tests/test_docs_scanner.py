@@ -3,9 +3,10 @@
 import os
 import tempfile
 from pathlib import Path
-from hypothesis import given, strategies as st, settings
+from hypothesis import given, strategies as st
 
 from translatex.docs.scanner import DocsScanner
+from translatex.docs.manifest import ManifestManager
 
 
 class TestFileDiscovery:
@@ -19,7 +20,6 @@ class TestFileDiscovery:
         md_count=st.integers(min_value=0, max_value=10),
         mdx_count=st.integers(min_value=0, max_value=10)
     )
-    @settings(max_examples=50)
     def test_finds_all_markdown_files(self, md_count, mdx_count):
         """For any directory, scanner SHALL find all .md and .mdx files."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -62,7 +62,6 @@ class TestDirectoryStructure:
     """
     
     @given(depth=st.integers(min_value=1, max_value=3))
-    @settings(max_examples=20)
     def test_directory_structure_mirrored(self, depth):
         """For any source directory, output SHALL have identical structure."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -172,3 +171,16 @@ class TestDocsScannerUnit:
             
             assert len(files) == 1
             assert files[0].relative_path == os.path.join("docs", "guide", "intro.md")
+    
+    def test_source_hash_matches_manifest(self):
+        """DocFile hashes should be comparable with manifest hashes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "source"
+            source.mkdir()
+            (source / "intro.md").write_text("# Intro")
+            
+            scanner = DocsScanner(str(source), str(Path(tmpdir) / "output"))
+            files = scanner.scan()
+            
+            assert files[0].source_hash == ManifestManager.get_file_hash(str(source / "intro.md"))
+            assert files[0].source_stat.st_size == len("# Intro")
@@ -1,13 +1,53 @@
 """Tests for FileLogger - Property 8: Log file contains required fields."""
 
+import io
 import os
 import re
+import logging
 import tempfile
-from hypothesis import given, strategies as st, settings
+
+import pytest
+from hypothesis import given, strategies as st
 
 from translatex.utils.file_logger import FileLogger
 
 
+# Format: "2024-01-01 12:00:00 | INFO     | message"
+_TS_RE = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}")
+_LEVEL_RE = re.compile(r"INFO\s*")
+
+
+@pytest.fixture(scope="module")
+def file_logger(tmp_path_factory):
+    """One DEBUG FileLogger for the property tests, truncated per example."""
+    tmpdir = tmp_path_factory.mktemp("logs")
+    log_file = tmpdir / "test.log"
+    logger = FileLogger(log_file=str(log_file), level="DEBUG", log_to_file=True)
+    logger.setup(str(tmpdir))
+    yield logger, log_file
+    logger.close()
+
+
+@pytest.fixture(scope="module")
+def log_buffer(file_logger):
+    """In-memory stream on the same logger, formatted like the file handler."""
+    logger, _ = file_logger
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logger._file_handler.formatter)
+    logger.logger.addHandler(handler)
+    yield stream
+    logger.logger.removeHandler(handler)
+
+
+def _read_fresh_entry(log_file, log):
+    """Truncate the log, emit one entry via log() and return the file content."""
+    # FileHandler appends (O_APPEND), so its next write lands at offset 0
+    log_file.write_bytes(b"")
+    log()
+    return log_file.read_text(encoding="utf-8")
+
+
 class TestFileLoggerProperties:
     """Property-based tests for FileLogger.
     
@@ -15,55 +55,32 @@ class TestFileLoggerProperties:
     **Validates: Requirements 8.2**
     """
     
-    @given(message=st.text(alphabet="abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 ", min_size=1, max_size=50))
-    @settings(max_examples=100)
-    def test_log_entry_contains_required_fields(self, message):
+    @given(message=st.from_regex(r"[A-Za-z0-9 ]{1,50}", fullmatch=True))
+    def test_log_entry_contains_required_fields(self, file_logger, log_buffer, message):
         """For any log message, the log entry SHALL contain timestamp, level, and message."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_file = os.path.join(tmpdir, "test.log")
-            logger = FileLogger(log_file=log_file, level="DEBUG", log_to_file=True)
-            logger.setup(tmpdir)
-            
-            # Log the message
-            logger.info(message)
-            
-            # Close logger to release file lock
-            logger.close()
-            
-            # Read log file
-            with open(log_file, "r", encoding="utf-8") as f:
-                log_content = f.read()
-            
-            # Verify required fields
-            # Format: "2024-01-01 12:00:00 | INFO     | message"
-            timestamp_pattern = r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}"
-            level_pattern = r"INFO\s*"
-            
-            assert re.search(timestamp_pattern, log_content), "Log entry missing timestamp"
-            assert re.search(level_pattern, log_content), "Log entry missing level"
-            assert message.strip() in log_content, "Log entry missing message"
+        logger, _ = file_logger
+        
+        # Assert on the in-memory copy of the entry; no file round-trip per example
+        log_buffer.seek(0)
+        log_buffer.truncate()
+        logger.info(message)
+        log_content = log_buffer.getvalue()
+        
+        # Verify required fields
+        assert _TS_RE.search(log_content), "Log entry missing timestamp"
+        assert _LEVEL_RE.search(log_content), "Log entry missing level"
+        assert message.strip() in log_content, "Log entry missing message"
     
-    @given(level=st.sampled_from(["DEBUG", "INFO", "WARNING", "ERROR"]))
-    @settings(max_examples=100)
-    def test_log_level_appears_in_output(self, level):
+    @pytest.mark.parametrize("level", ["DEBUG", "INFO", "WARNING", "ERROR"])
+    def test_log_level_appears_in_output(self, file_logger, level):
         """For any log level, the level SHALL appear in the log entry."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_file = os.path.join(tmpdir, "test.log")
-            logger = FileLogger(log_file=log_file, level="DEBUG", log_to_file=True)
-            logger.setup(tmpdir)
-            
-            # Log at specified level
-            log_method = getattr(logger, level.lower())
-            log_method("test message")
-            
-            # Close logger to release file lock
-            logger.close()
-            
-            # Read and verify
-            with open(log_file, "r", encoding="utf-8") as f:
-                log_content = f.read()
-            
-            assert level in log_content, f"Log level {level} not found in output"
+        logger, log_file = file_logger
+        
+        # Log at specified level
+        log_method = getattr(logger, level.lower())
+        log_content = _read_fresh_entry(log_file, lambda: log_method("test message"))
+        
+        assert level in log_content, f"Log level {level} not found in output"
 
 
 class TestFileLoggerUnit:
@@ -97,3 +114,17 @@ class TestFileLoggerUnit:
             assert "Total segments: 10" in content
             assert "Translated: 8" in content
             assert "Cached: 2" in content
+    
+    def test_log_summary_file_only_at_any_level(self, capsys):
+        """Summary should reach the file even above INFO, and never the console."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = os.path.join(tmpdir, "test.log")
+            logger = FileLogger(log_file=log_file, level="ERROR", log_to_file=True)
+            logger.setup(tmpdir)
+            
+            logger.log_summary({"Translated": 8})
+            logger.close()
+            
+            with open(log_file, "r", encoding="utf-8") as f:
+                assert "Translated: 8" in f.read()
+            assert "Translated" not in capsys.readouterr().out
@@ -3,8 +3,34 @@ Property-based tests for LLMClientFactory
 Uses Hypothesis for property-based testing
 """
 import pytest
-from hypothesis import given, strategies as st, settings
+from hypothesis import given, settings, strategies as st
 from translatex.utils.llm_client_factory import LLMClientFactory
+from translatex.utils.ollama_cloud_client import OllamaCloudClient
+
+
+# Models treated as free without a ":free" suffix (one hash lookup per draw)
+_FREE_LIST_MODELS = frozenset(
+    LLMClientFactory.GROQ_MODELS
+    + LLMClientFactory.GEMINI_MODELS
+    + LLMClientFactory.OLLAMA_MODELS
+)
+
+
+# Representative invalid names: empty, case/whitespace variants, unknown, unicode, long
+_INVALID_PROVIDERS = ["foo", "", "OPENAI", "openai ", "anthropic", "🦄", "null", "None", pytest.param("x" * 1000, id="long")]
+
+
+# Expected base URLs, looked up once rather than in every test case
+_EXPECTED_URLS = {p: LLMClientFactory.PROVIDERS[p]["base_url"] for p in ("openai", "openrouter", "groq")}
+
+
+def _not_free(model: str) -> bool:
+    return not model.endswith(":free") and model not in _FREE_LIST_MODELS
+
+
+def _free_flags(models) -> dict:
+    """Map each model to is_free_model(), so one assert reports every mismatch."""
+    return {model: LLMClientFactory.is_free_model(model) for model in models}
 
 
 class TestProviderEndpointMapping:
@@ -15,17 +41,13 @@ class TestProviderEndpointMapping:
     **Validates: Requirements 1.1, 1.2**
     """
     
-    @given(provider=st.sampled_from(["openai", "openrouter", "groq"]))
-    @settings(max_examples=100)
+    @pytest.mark.parametrize("provider", _EXPECTED_URLS)
     def test_valid_provider_returns_correct_base_url(self, provider: str):
         """Property: Valid providers map to correct base URLs"""
-        expected_base_url = LLMClientFactory.PROVIDERS[provider]["base_url"]
-        actual_base_url = LLMClientFactory.get_base_url(provider)
-        assert actual_base_url == expected_base_url
+        assert LLMClientFactory.get_base_url(provider) == _EXPECTED_URLS[provider]
     
-    @given(provider=st.sampled_from(["openai", "openrouter", "groq"]))
-    @settings(max_examples=100, deadline=None)
-    def test_valid_provider_creates_client_successfully(self, provider: str):
+    @pytest.mark.parametrize("provider", _EXPECTED_URLS)
+    def test_valid_provider_creates_client_successfully(self, lightweight_openai, provider: str):
         """Property: Valid providers with valid API key create client without error"""
         # Use a dummy API key for testing client creation
         dummy_key = "test-api-key-12345"
@@ -33,7 +55,7 @@ class TestProviderEndpointMapping:
         assert client is not None
         
         # Verify base_url is set correctly
-        expected_base_url = LLMClientFactory.PROVIDERS[provider]["base_url"]
+        expected_base_url = _EXPECTED_URLS[provider]
         if expected_base_url:
             assert str(client.base_url).rstrip('/') == expected_base_url.rstrip('/')
     
@@ -58,8 +80,7 @@ class TestInvalidProviderRejection:
     **Validates: Requirements 1.3**
     """
     
-    @given(provider=st.text().filter(lambda x: x not in ["openai", "openrouter", "groq"]))
-    @settings(max_examples=100)
+    @pytest.mark.parametrize("provider", _INVALID_PROVIDERS)
     def test_invalid_provider_raises_value_error(self, provider: str):
         """Property: Invalid providers raise ValueError"""
         with pytest.raises(ValueError) as exc_info:
@@ -69,12 +90,17 @@ class TestInvalidProviderRejection:
         assert "openai" in str(exc_info.value)
         assert "openrouter" in str(exc_info.value)
     
-    @given(provider=st.text().filter(lambda x: x not in ["openai", "openrouter", "groq", "gemini", "ollama", "ollama-cloud"]))
-    @settings(max_examples=100)
+    @pytest.mark.parametrize("provider", _INVALID_PROVIDERS)
     def test_invalid_provider_validation_returns_false(self, provider: str):
         """Property: Invalid providers fail validation"""
         assert LLMClientFactory.validate_provider(provider) is False
     
+    @given(provider=st.text(max_size=20).filter(lambda p: p not in LLMClientFactory.PROVIDERS))
+    @settings(max_examples=10)
+    def test_random_provider_rejected(self, provider: str):
+        """Property: Fuzzed non-provider strings fail validation (smoke run)"""
+        assert LLMClientFactory.validate_provider(provider) is False
+    
     def test_empty_string_provider_rejected(self):
         """Empty string should be rejected as invalid provider"""
         assert LLMClientFactory.validate_provider("") is False
@@ -96,27 +122,38 @@ class TestFreeModelDetection:
     **Validates: Requirements 6.2**
     """
     
-    @given(model_base=st.text(min_size=1))
-    @settings(max_examples=100)
+    @given(model_base=st.from_regex(r"[A-Za-z0-9/_-]{1,20}", fullmatch=True))
     def test_model_with_free_suffix_detected(self, model_base: str):
         """Property: Any model ending with :free is detected as free"""
         free_model = f"{model_base}:free"
         assert LLMClientFactory.is_free_model(free_model) is True
     
-    @given(model=st.text().filter(
-        lambda x: not x.endswith(":free") 
-        and x not in LLMClientFactory.GROQ_MODELS 
-        and x not in LLMClientFactory.GEMINI_MODELS
-    ))
-    @settings(max_examples=100)
+    @pytest.mark.parametrize("model_base", ["", "a", "foo/bar", "🦄", "模型", " ", ":free"])
+    def test_unusual_model_with_free_suffix_detected(self, model_base: str):
+        """Empty, unicode and whitespace bases with :free are detected as free"""
+        assert LLMClientFactory.is_free_model(f"{model_base}:free") is True
+    
+    @pytest.mark.parametrize("model", [
+        "",
+        "gpt-4o",
+        "anthropic/claude-3-opus",
+        "model:FREE",
+        "model:free ",
+        "free",
+        "model:free:paid",
+    ])
     def test_model_without_free_suffix_not_detected(self, model: str):
         """Property: Models not ending with :free and not in free lists are not free"""
         assert LLMClientFactory.is_free_model(model) is False
     
+    @given(model=st.from_regex(r"[a-z0-9/_.:-]{1,30}", fullmatch=True).filter(_not_free))
+    def test_generated_model_without_free_suffix_not_detected(self, model: str):
+        """Property: Models not ending with :free and not in free lists are not free"""
+        assert LLMClientFactory.is_free_model(model) is False
+    
     def test_known_free_models(self):
         """All known free models should be detected"""
-        for model in LLMClientFactory.FREE_MODELS:
-            assert LLMClientFactory.is_free_model(model) is True
+        assert _free_flags(LLMClientFactory.FREE_MODELS) == dict.fromkeys(LLMClientFactory.FREE_MODELS, True)
     
     def test_paid_models_not_free(self):
         """Paid models should not be detected as free"""
@@ -126,71 +163,67 @@ class TestFreeModelDetection:
             "claude-3-sonnet",
             "google/gemma-2-9b-it",  # Without :free suffix
         ]
-        for model in paid_models:
-            assert LLMClientFactory.is_free_model(model) is False
+        assert _free_flags(paid_models) == dict.fromkeys(paid_models, False)
     
     def test_groq_models_are_free(self):
         """Groq models should be detected as free"""
-        for model in LLMClientFactory.GROQ_MODELS:
-            assert LLMClientFactory.is_free_model(model) is True
+        assert _free_flags(LLMClientFactory.GROQ_MODELS) == dict.fromkeys(LLMClientFactory.GROQ_MODELS, True)
     
     def test_gemini_models_are_free(self):
         """Gemini models should be detected as free"""
-        for model in LLMClientFactory.GEMINI_MODELS:
-            assert LLMClientFactory.is_free_model(model) is True
+        assert _free_flags(LLMClientFactory.GEMINI_MODELS) == dict.fromkeys(LLMClientFactory.GEMINI_MODELS, True)
     
     def test_ollama_models_are_free(self):
         """Ollama models should be detected as free"""
-        for model in LLMClientFactory.OLLAMA_MODELS:
-            assert LLMClientFactory.is_free_model(model) is True
+        assert _free_flags(LLMClientFactory.OLLAMA_MODELS) == dict.fromkeys(LLMClientFactory.OLLAMA_MODELS, True)
+
+
+# name, base_url, key_field, model list attr, expected models, rate-limit probe model, rpm, concurrency
+PROVIDER_TABLE = [
+    ("ollama", "http://localhost:11434/v1", None, "OLLAMA_MODELS",
+     ["qwen3:8b", "qwen3:4b", "llama3.1:8b", "gemma2:9b", "mistral:7b"], "qwen3:8b", 60, 2),
+    ("ollama-cloud", "https://ollama.com/api", "ollama_api_key", "OLLAMA_CLOUD_MODELS",
+     ["qwen3:235b-cloud", "qwen3-vl:235b-cloud", "qwen3-coder:480b-cloud"], "qwen3:235b-cloud", 30, 5),
+    ("deepseek", "https://api.deepseek.com/v1", "deepseek_api_key", "DEEPSEEK_MODELS",
+     ["deepseek-chat", "deepseek-reasoner"], "deepseek-chat", 60, 10),
+]
+
+
+class TestProviderContract:
+    """Provider registration, endpoint, key field, model list and rate limits"""
+    
+    @pytest.mark.parametrize(
+        ("name", "base_url", "key_field", "models_attr", "expected_models", "rate_model", "rpm", "concurrent"),
+        PROVIDER_TABLE,
+        ids=[row[0] for row in PROVIDER_TABLE],
+    )
+    def test_provider_contract(self, name, base_url, key_field, models_attr, expected_models, rate_model, rpm, concurrent):
+        """Each provider should be registered with its endpoint, key field, models and rate limits"""
+        assert LLMClientFactory.validate_provider(name) is True
+        assert LLMClientFactory.get_base_url(name) == base_url
+        assert LLMClientFactory.PROVIDERS[name]["key_field"] == key_field
+        
+        models = getattr(LLMClientFactory, models_attr)
+        assert [model for model in expected_models if model not in models] == []
+        
+        config = LLMClientFactory.get_rate_limit_config(rate_model)
+        assert (config["rpm"], config["recommended_concurrent"]) == (rpm, concurrent)
 
 
 class TestOllamaProvider:
     """Test Ollama provider integration"""
     
-    def test_ollama_provider_exists(self):
-        """Ollama should be a valid provider"""
-        assert LLMClientFactory.validate_provider("ollama") is True
-    
-    def test_ollama_uses_correct_endpoint(self):
-        """Ollama provider should use localhost endpoint"""
-        assert LLMClientFactory.get_base_url("ollama") == "http://localhost:11434/v1"
-    
-    def test_ollama_no_api_key_required(self):
+    def test_ollama_no_api_key_required(self, lightweight_openai):
         """Ollama should not require API key"""
         # Should not raise error even with empty API key
         client = LLMClientFactory.create_client("ollama", "")
         assert client is not None
         assert str(client.base_url).rstrip('/') == "http://localhost:11434/v1"
-    
-    def test_ollama_api_key_field_is_none(self):
-        """Ollama should have None as key_field"""
-        assert LLMClientFactory.PROVIDERS["ollama"]["key_field"] is None
-    
-    def test_ollama_models_in_list(self):
-        """Ollama models list should contain expected models"""
-        expected_models = ["qwen3:8b", "qwen3:4b", "llama3.1:8b", "gemma2:9b", "mistral:7b"]
-        for model in expected_models:
-            assert model in LLMClientFactory.OLLAMA_MODELS
-    
-    def test_ollama_rate_limits_configured(self):
-        """Ollama models should have rate limit config"""
-        config = LLMClientFactory.get_rate_limit_config("qwen3:8b")
-        assert config["rpm"] == 60
-        assert config["recommended_concurrent"] == 2
 
 
 class TestOllamaCloudProvider:
     """Test Ollama Cloud provider integration"""
     
-    def test_ollama_cloud_provider_exists(self):
-        """Ollama Cloud should be a valid provider"""
-        assert LLMClientFactory.validate_provider("ollama-cloud") is True
-    
-    def test_ollama_cloud_uses_correct_endpoint(self):
-        """Ollama Cloud provider should use ollama.com/api endpoint"""
-        assert LLMClientFactory.get_base_url("ollama-cloud") == "https://ollama.com/api"
-    
     def test_ollama_cloud_requires_api_key(self):
         """Ollama Cloud should require API key"""
         assert LLMClientFactory.PROVIDERS["ollama-cloud"]["key_field"] == "ollama_api_key"
@@ -201,41 +234,19 @@ class TestOllamaCloudProvider:
     
     def test_ollama_cloud_creates_client_with_key(self):
         """Ollama Cloud should create client with valid API key"""
-        from translatex.utils.ollama_cloud_client import OllamaCloudClient
         client = LLMClientFactory.create_client("ollama-cloud", "test-api-key")
         assert client is not None
         assert isinstance(client, OllamaCloudClient)
         assert client.api_key == "test-api-key"
     
-    def test_ollama_cloud_models_in_list(self):
-        """Ollama Cloud models list should contain expected models"""
-        expected_models = ["qwen3:235b-cloud", "qwen3-vl:235b-cloud", "qwen3-coder:480b-cloud"]
-        for model in expected_models:
-            assert model in LLMClientFactory.OLLAMA_CLOUD_MODELS
-    
     def test_ollama_cloud_models_not_free(self):
         """Ollama Cloud models should NOT be detected as free"""
-        for model in LLMClientFactory.OLLAMA_CLOUD_MODELS:
-            assert LLMClientFactory.is_free_model(model) is False
-    
-    def test_ollama_cloud_rate_limits_configured(self):
-        """Ollama Cloud models should have rate limit config"""
-        config = LLMClientFactory.get_rate_limit_config("qwen3:235b-cloud")
-        assert config["rpm"] == 30
-        assert config["recommended_concurrent"] == 5
+        assert _free_flags(LLMClientFactory.OLLAMA_CLOUD_MODELS) == dict.fromkeys(LLMClientFactory.OLLAMA_CLOUD_MODELS, False)
 
 
 class TestDeepSeekProvider:
     """Test DeepSeek provider integration"""
     
-    def test_deepseek_provider_exists(self):
-        """DeepSeek should be a valid provider"""
-        assert LLMClientFactory.validate_provider("deepseek") is True
-    
-    def test_deepseek_uses_correct_endpoint(self):
-        """DeepSeek provider should use api.deepseek.com endpoint"""
-        assert LLMClientFactory.get_base_url("deepseek") == "https://api.deepseek.com/v1"
-    
     def test_deepseek_requires_api_key(self):
         """DeepSeek should require API key"""
         assert LLMClientFactory.PROVIDERS["deepseek"]["key_field"] == "deepseek_api_key"
@@ -243,29 +254,17 @@ class TestDeepSeekProvider:
         with pytest.raises(ValueError):
             LLMClientFactory.create_client("deepseek", "")
     
-    def test_deepseek_creates_client_with_key(self):
+    def test_deepseek_creates_client_with_key(self, lightweight_openai):
         """DeepSeek should create client with valid API key"""
         client = LLMClientFactory.create_client("deepseek", "test-api-key")
         assert client is not None
         assert str(client.base_url).rstrip('/') == "https://api.deepseek.com/v1"
-    
-    def test_deepseek_models_in_list(self):
-        """DeepSeek models list should contain expected models"""
-        assert "deepseek-chat" in LLMClientFactory.DEEPSEEK_MODELS
-        assert "deepseek-reasoner" in LLMClientFactory.DEEPSEEK_MODELS
-    
-    def test_deepseek_rate_limits_configured(self):
-        """DeepSeek models should have rate limit config"""
-        config = LLMClientFactory.get_rate_limit_config("deepseek-chat")
-        assert config["rpm"] == 60
-        assert config["recommended_concurrent"] == 10
 
 
 class TestAPIKeyValidation:
     """Test API key validation in create_client"""
     
-    @given(provider=st.sampled_from(["openai", "openrouter", "groq"]))
-    @settings(max_examples=100)
+    @pytest.mark.parametrize("provider", ["openai", "openrouter", "groq"])
     def test_missing_api_key_raises_error(self, provider: str):
         """Property: Missing API key raises ValueError with helpful message"""
         with pytest.raises(ValueError) as exc_info:
@@ -274,8 +273,7 @@ class TestAPIKeyValidation:
         expected_key_field = LLMClientFactory.get_api_key_field(provider)
         assert expected_key_field in str(exc_info.value)
     
-    @given(provider=st.sampled_from(["openai", "openrouter", "groq"]))
-    @settings(max_examples=100)
+    @pytest.mark.parametrize("provider", ["openai", "openrouter", "groq"])
     def test_get_api_key_field_returns_correct_field(self, provider: str):
         """Property: get_api_key_field returns correct field name for provider"""
         expected = LLMClientFactory.PROVIDERS[provider]["key_field"]
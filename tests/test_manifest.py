@@ -1,13 +1,28 @@
 """Tests for ManifestManager - Properties 10-11."""
 
 import os
+import json
+import hashlib
 import tempfile
+import itertools
 from pathlib import Path
-from hypothesis import given, strategies as st, settings
+
+import pytest
+from hypothesis import given, strategies as st
 
 from translatex.docs.manifest import ManifestManager
 
 
+# Unique per-example file names, so property examples share one directory
+_example_ids = itertools.count()
+
+
+@pytest.fixture(scope="module")
+def manifest_dir(tmp_path_factory):
+    """One directory for all property examples in this module."""
+    return tmp_path_factory.mktemp("manifest")
+
+
 class TestFileChangeDetection:
     """Property-based tests for file change detection.
     
@@ -15,62 +30,62 @@ class TestFileChangeDetection:
     **Validates: Requirements 5.1, 5.2**
     """
     
-    @given(content=st.text(alphabet="abcdefghijklmnopqrstuvwxyz0123456789 \n", min_size=10, max_size=100))
-    @settings(max_examples=50)
-    def test_unchanged_file_detected(self, content):
+    @given(content=st.text(alphabet="abcdefghijklmnopqrstuvwxyz0123456789 \n", min_size=1, max_size=20))
+    def test_unchanged_file_detected(self, manifest_dir, content):
         """For any unchanged file, is_changed SHALL return False."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create manifest
-            manifest_file = Path(tmpdir) / "manifest.json"
-            manifest = ManifestManager(str(manifest_file))
-            
-            # Create a file
-            test_file = Path(tmpdir) / "test.md"
-            test_file.write_text(content, encoding="utf-8")
-            
-            # Record in manifest
-            file_hash = manifest.get_file_hash(str(test_file))
-            manifest.update("test.md", file_hash, str(test_file))
-            manifest.save()
-            
-            # Load fresh manifest
-            manifest2 = ManifestManager(str(manifest_file))
-            manifest2.load()
-            
-            # File should be detected as unchanged
-            assert not manifest2.is_changed("test.md", str(test_file))
+        n = next(_example_ids)
+        # Create manifest
+        manifest_file = manifest_dir / f"manifest_{n}.json"
+        manifest = ManifestManager(str(manifest_file))
+        
+        # Create a file
+        data = content.encode("utf-8")
+        test_file = manifest_dir / f"test_{n}.md"
+        test_file.write_bytes(data)
+        
+        # Record in manifest (hash the bytes we wrote, no read-back)
+        file_hash = ManifestManager.hash_bytes(data)
+        manifest.update("test.md", file_hash, str(test_file))
+        manifest.save()
+        
+        # Load fresh manifest
+        manifest2 = ManifestManager(str(manifest_file))
+        manifest2.load()
+        
+        # File should be detected as unchanged
+        assert not manifest2.is_changed("test.md", str(test_file))
     
     @given(
-        content1=st.text(alphabet="abcdefghijklmnopqrstuvwxyz0123456789 ", min_size=10, max_size=50),
-        content2=st.text(alphabet="abcdefghijklmnopqrstuvwxyz0123456789 ", min_size=10, max_size=50)
+        content1=st.text(alphabet="abcdefghijklmnopqrstuvwxyz0123456789 ", min_size=1, max_size=20),
+        suffix=st.text(alphabet="abcdefghijklmnopqrstuvwxyz0123456789 ", min_size=1, max_size=10)
     )
-    @settings(max_examples=50)
-    def test_changed_file_detected(self, content1, content2):
+    def test_changed_file_detected(self, manifest_dir, content1, suffix):
         """For any changed file, is_changed SHALL return True."""
-        if content1 == content2:
-            return  # Skip if same content
+        # Appending a non-empty suffix guarantees the content differs
+        content2 = content1 + suffix
         
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manifest_file = Path(tmpdir) / "manifest.json"
-            manifest = ManifestManager(str(manifest_file))
-            
-            test_file = Path(tmpdir) / "test.md"
-            
-            # Write initial content
-            test_file.write_text(content1, encoding="utf-8")
-            file_hash = manifest.get_file_hash(str(test_file))
-            manifest.update("test.md", file_hash, str(test_file))
-            manifest.save()
-            
-            # Change file content
-            test_file.write_text(content2, encoding="utf-8")
-            
-            # Load fresh manifest
-            manifest2 = ManifestManager(str(manifest_file))
-            manifest2.load()
-            
-            # File should be detected as changed
-            assert manifest2.is_changed("test.md", str(test_file))
+        n = next(_example_ids)
+        manifest_file = manifest_dir / f"manifest_{n}.json"
+        manifest = ManifestManager(str(manifest_file))
+        
+        test_file = manifest_dir / f"test_{n}.md"
+        
+        # Write initial content
+        data = content1.encode("utf-8")
+        test_file.write_bytes(data)
+        file_hash = ManifestManager.hash_bytes(data)
+        manifest.update("test.md", file_hash, str(test_file))
+        manifest.save()
+        
+        # Change file content
+        test_file.write_text(content2, encoding="utf-8")
+        
+        # Load fresh manifest
+        manifest2 = ManifestManager(str(manifest_file))
+        manifest2.load()
+        
+        # File should be detected as changed
+        assert manifest2.is_changed("test.md", str(test_file))
 
 
 class TestManifestAccuracy:
@@ -88,32 +103,32 @@ class TestManifestAccuracy:
             unique=True
         )
     )
-    @settings(max_examples=50)
-    def test_manifest_contains_all_files(self, files):
+    def test_manifest_contains_all_files(self, manifest_dir, files):
         """For any set of files, manifest SHALL contain accurate entries."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manifest_file = Path(tmpdir) / "manifest.json"
-            manifest = ManifestManager(str(manifest_file))
-            
-            # Create files and add to manifest
-            for filename in files:
-                filepath = Path(tmpdir) / f"{filename}.md"
-                filepath.write_text(f"# {filename}")
-                
-                file_hash = manifest.get_file_hash(str(filepath))
-                manifest.update(f"{filename}.md", file_hash, str(filepath))
-            
-            manifest.save()
-            
-            # Load and verify
-            manifest2 = ManifestManager(str(manifest_file))
-            manifest2.load()
-            
-            entries = manifest2.get_all_entries()
-            assert len(entries) == len(files)
-            
-            for filename in files:
-                assert f"{filename}.md" in entries
+        n = next(_example_ids)
+        manifest_file = manifest_dir / f"manifest_{n}.json"
+        manifest = ManifestManager(str(manifest_file))
+        
+        # Create files, then add them to the manifest in one batch
+        entries = []
+        for filename in files:
+            data = f"# {filename}".encode("utf-8")
+            filepath = manifest_dir / f"{n}_{filename}.md"
+            filepath.write_bytes(data)
+            entries.append((f"{filename}.md", ManifestManager.hash_bytes(data), str(filepath)))
+        
+        manifest.bulk_update(entries)
+        manifest.save()
+        
+        # Load and verify
+        manifest2 = ManifestManager(str(manifest_file))
+        manifest2.load()
+        
+        entries = manifest2.get_all_entries()
+        assert len(entries) == len(files)
+        
+        for filename in files:
+            assert f"{filename}.md" in entries
 
 
 class TestManifestManagerUnit:
@@ -145,6 +160,19 @@ class TestManifestManagerUnit:
             assert manifest2.get_entry("test.md") is not None
             assert manifest2.get_entry("test.md")["source_hash"] == "abc123"
     
+    def test_save_replaces_without_leftover_tmp(self):
+        """Saving over an existing manifest should leave no temp file behind."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manifest_file = Path(tmpdir) / "manifest.json"
+            manifest = ManifestManager(str(manifest_file))
+            manifest.update("tài liệu.md", "hash1", "/out")
+            manifest.save()
+            manifest.update("b.md", "hash2", "/out/b.md")
+            manifest.save()
+            
+            assert [p.name for p in Path(tmpdir).iterdir()] == ["manifest.json"]
+            assert "tài liệu.md" in manifest_file.read_text(encoding="utf-8")
+    
     def test_remove_entry(self):
         """Entry should be removable."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -191,3 +219,125 @@ class TestManifestManagerUnit:
             
             # File not in manifest should be "changed" (needs translation)
             assert manifest.is_changed("new.md", str(test_file))
+    
+    def test_hash_bytes_matches_file_hash(self):
+        """hash_bytes should agree with get_file_hash for the same content."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manifest = ManifestManager(str(Path(tmpdir) / "manifest.json"))
+            
+            test_file = Path(tmpdir) / "doc.md"
+            test_file.write_bytes(b"# Doc\n\ncontent")
+            
+            assert ManifestManager.hash_bytes(b"# Doc\n\ncontent") == manifest.get_file_hash(str(test_file))
+    
+    def test_unknown_version_manifest_discarded(self):
+        """A manifest with an unknown version should not load."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manifest_file = Path(tmpdir) / "manifest.json"
+            manifest_file.write_text('{"version": "0.9", "files": {"a.md": {"source_hash": "ab"}}}')
+            
+            manifest = ManifestManager(str(manifest_file))
+            
+            assert not manifest.load()
+            assert manifest.get_all_entries() == {}
+    
+    def test_legacy_manifest_migrated(self):
+        """A 1.0 (SHA-256) manifest should keep unchanged files unchanged."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "docs"
+            source.mkdir()
+            (source / "same.md").write_bytes(b"# Same")
+            (source / "edited.md").write_bytes(b"# Edited later")
+            entry = {"output_path": "/out", "translated_at": "2025-01-01T00:00:00"}
+            legacy = {
+                "version": "1.0",
+                "source_dir": str(source),
+                "output_dir": "/out",
+                "created_at": "2025-01-01T00:00:00",
+                "updated_at": "2025-01-01T00:00:00",
+                "files": {
+                    "same.md": {**entry, "source_hash": hashlib.sha256(b"# Same").hexdigest()},
+                    "edited.md": {**entry, "source_hash": hashlib.sha256(b"# Edited").hexdigest()},
+                    "gone.md": {**entry, "source_hash": hashlib.sha256(b"# Gone").hexdigest()},
+                },
+            }
+            manifest_file = Path(tmpdir) / "manifest.json"
+            manifest_file.write_text(json.dumps(legacy))
+            
+            manifest = ManifestManager(str(manifest_file))
+            assert manifest.load()
+            
+            assert not manifest.is_changed("same.md", str(source / "same.md"))
+            assert manifest.is_changed("edited.md", str(source / "edited.md"))
+            assert manifest.get_entry("same.md")["source_hash"] == manifest.get_file_hash(str(source / "same.md"))
+            assert list(manifest.get_all_entries()) == ["same.md"]
+            
+            # Saved back in the current format
+            assert json.loads(manifest_file.read_text())["version"] == ManifestManager.MANIFEST_VERSION
+    
+    def test_unchanged_stat_skips_hashing(self, monkeypatch):
+        """Matching mtime and size should short-circuit without hashing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manifest = ManifestManager(str(Path(tmpdir) / "manifest.json"))
+            test_file = Path(tmpdir) / "doc.md"
+            test_file.write_text("# Doc")
+            
+            assert manifest.is_changed("doc.md", str(test_file))
+            st, file_hash = manifest.stat_and_hash(str(test_file))
+            manifest.update("doc.md", file_hash, "/out/doc.md", st)
+            
+            def fail(path):
+                raise AssertionError("file was re-hashed")
+            monkeypatch.setattr(manifest, "get_file_hash", fail)
+            assert not manifest.is_changed("doc.md", str(test_file))
+    
+    def test_same_size_edit_detected(self):
+        """A same-size edit with a new mtime should still be detected."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manifest = ManifestManager(str(Path(tmpdir) / "manifest.json"))
+            test_file = Path(tmpdir) / "doc.md"
+            test_file.write_text("# One")
+            
+            st, file_hash = manifest.stat_and_hash(str(test_file))
+            manifest.update("doc.md", file_hash, "/out/doc.md", st)
+            
+            test_file.write_text("# Two")
+            st = test_file.stat()
+            os.utime(test_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+            
+            assert manifest.is_changed("doc.md", str(test_file))
+    
+    def test_edit_after_hashing_not_masked(self):
+        """An edit between hashing and the change check must stay detectable."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manifest = ManifestManager(str(Path(tmpdir) / "manifest.json"))
+            test_file = Path(tmpdir) / "doc.md"
+            test_file.write_text("# One")
+            
+            # Hash at scan time, then the file is edited before the check
+            st, file_hash = manifest.stat_and_hash(str(test_file))
+            test_file.write_text("# Two!")
+            os.utime(test_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+            assert manifest.is_changed("doc.md", str(test_file))
+            manifest.update("doc.md", file_hash, "/out/doc.md", st)
+            
+            # The recorded stat belongs to the hashed content, so the edit shows
+            assert manifest.is_changed("doc.md", str(test_file))
+    
+    def test_batch_is_changed_matches_is_changed(self):
+        """batch_is_changed should agree with per-file is_changed."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manifest = ManifestManager(str(Path(tmpdir) / "manifest.json"))
+            items = []
+            for i in range(6):
+                test_file = Path(tmpdir) / f"doc{i}.md"
+                test_file.write_text(f"# Doc {i}")
+                items.append((test_file.name, str(test_file)))
+            for rel, src in items[:3]:
+                manifest.update(rel, manifest.get_file_hash(src), "/out/" + rel)
+            items.append(("missing.md", str(Path(tmpdir) / "missing.md")))
+            
+            changed = manifest.batch_is_changed(items)
+            
+            assert changed == {rel: manifest.is_changed(rel, src) for rel, src in items}
+            assert [rel for rel, flag in changed.items() if not flag] == ["doc0.md", "doc1.md", "doc2.md"]
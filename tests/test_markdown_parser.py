@@ -2,9 +2,48 @@
 
 import tempfile
 import os
-from hypothesis import given, strategies as st, settings
 
-from translatex.docs.markdown_parser import MarkdownParser, ContentBlock
+from hypothesis import given, strategies as st
+
+from translatex.docs.markdown_parser import ContentBlock
+
+
+# Document templates, bound once (str.format) instead of per-example f-strings
+_FENCE = "```{lang}\n{code}\n```".format
+_CODE_BLOCK_DOC = "# Title\n\nSome text\n\n{}\n\nMore text".format
+_INLINE_CODE_DOC = "Use the `{}` command to run.".format
+_LINK_URL = "https://example.com/{}".format
+_LINK_DOC = "Check out [{}]({}) for more info.".format
+_IMAGE_PATH = "/images/{}.png".format
+_IMAGE_DOC = "See the diagram below:\n\n![{}]({})\n\nAs shown above.".format
+_FRONTMATTER_DOC = "---\ntitle: {}\nslug: {}\n---\n\n# Content here\n".format
+
+
+# Documents are assembled inside the strategies, so the shrinker only
+# works on the drawn parts. Each yields (content, text expected in output).
+_code_block_docs = st.builds(
+    _FENCE,
+    code=st.text(alphabet="abcdefghijklmnopqrstuvwxyz0123456789_=(){}[];", min_size=1, max_size=20),
+    lang=st.sampled_from(["python", "javascript", "bash", "typescript", "json", ""]),
+).map(lambda block: (_CODE_BLOCK_DOC(block), block))
+
+_link_docs = st.builds(
+    lambda text, url: (_LINK_DOC(text, url), url),
+    st.text(alphabet="abcdefghijklmnopqrstuvwxyz ", min_size=1, max_size=20),
+    st.text(alphabet="abcdefghijklmnopqrstuvwxyz0123456789/-_.", min_size=5, max_size=30).map(_LINK_URL),
+)
+
+_image_docs = st.builds(
+    lambda alt, img_path: (_IMAGE_DOC(alt, img_path), img_path),
+    st.text(alphabet="abcdefghijklmnopqrstuvwxyz ", min_size=1, max_size=20),
+    st.text(alphabet="abcdefghijklmnopqrstuvwxyz0123456789-_", min_size=3, max_size=15).map(_IMAGE_PATH),
+)
+
+_frontmatter_docs = st.builds(
+    lambda title, slug: (_FRONTMATTER_DOC(title, slug), slug),
+    st.text(alphabet="abcdefghijklmnopqrstuvwxyz ", min_size=3, max_size=30),
+    st.text(alphabet="abcdefghijklmnopqrstuvwxyz-", min_size=3, max_size=20),
+)
 
 
 class TestCodeBlockPreservation:
@@ -14,26 +53,15 @@ class TestCodeBlockPreservation:
     **Validates: Requirements 1.2, 4.1**
     """
     
-    @given(
-        code=st.text(alphabet="abcdefghijklmnopqrstuvwxyz0123456789_=(){}[];", min_size=1, max_size=100),
-        lang=st.sampled_from(["python", "javascript", "bash", "typescript", "json", ""])
-    )
-    @settings(max_examples=100)
-    def test_code_blocks_preserved(self, code, lang):
+    @given(doc=_code_block_docs)
+    def test_code_blocks_preserved(self, md_round_trip, doc):
         """For any markdown with code blocks, code blocks SHALL be preserved."""
-        parser = MarkdownParser()
-        
-        # Create markdown with code block
-        content = f"# Title\n\nSome text\n\n```{lang}\n{code}\n```\n\nMore text"
-        
-        # Parse
-        blocks = parser.parse(content)
+        content, expected_block = doc
         
-        # Reconstruct
-        result = parser.reconstruct(blocks)
+        # Parse and reconstruct
+        result = md_round_trip(content)
         
         # Verify code block is preserved
-        expected_block = f"```{lang}\n{code}\n```"
         assert expected_block in result, f"Code block not preserved: {expected_block}"
 
 
@@ -45,17 +73,15 @@ class TestInlineCodePreservation:
     """
     
     @given(code=st.text(alphabet="abcdefghijklmnopqrstuvwxyz0123456789_.", min_size=1, max_size=30))
-    @settings(max_examples=100)
-    def test_inline_code_preserved(self, code):
+    def test_inline_code_preserved(self, md_round_trip, code):
         """For any markdown with inline code, inline code SHALL be preserved."""
-        parser = MarkdownParser()
         
-        content = f"Use the `{code}` command to run."
+        content = _INLINE_CODE_DOC(code)
         
-        blocks = parser.parse(content)
-        result = parser.reconstruct(blocks)
+        result = md_round_trip(content)
         
-        assert f"`{code}`" in result, f"Inline code not preserved: `{code}`"
+        # Prose around inline code round-trips unchanged
+        assert result == content, f"Inline code not preserved: `{code}`"
 
 
 class TestLinksPreservation:
@@ -65,38 +91,22 @@ class TestLinksPreservation:
     **Validates: Requirements 1.4**
     """
     
-    @given(
-        text=st.text(alphabet="abcdefghijklmnopqrstuvwxyz ", min_size=1, max_size=20),
-        url=st.text(alphabet="abcdefghijklmnopqrstuvwxyz0123456789/-_.", min_size=5, max_size=30)
-    )
-    @settings(max_examples=100)
-    def test_links_preserved(self, text, url):
+    @given(doc=_link_docs)
+    def test_links_preserved(self, md_round_trip, doc):
         """For any markdown with links, links SHALL be preserved."""
-        parser = MarkdownParser()
+        content, full_url = doc
         
-        full_url = f"https://example.com/{url}"
-        content = f"Check out [{text}]({full_url}) for more info."
-        
-        blocks = parser.parse(content)
-        result = parser.reconstruct(blocks)
+        result = md_round_trip(content)
         
         # URL should be preserved
         assert full_url in result, f"URL not preserved: {full_url}"
     
-    @given(
-        alt=st.text(alphabet="abcdefghijklmnopqrstuvwxyz ", min_size=1, max_size=20),
-        filename=st.text(alphabet="abcdefghijklmnopqrstuvwxyz0123456789-_", min_size=3, max_size=15)
-    )
-    @settings(max_examples=100)
-    def test_images_preserved(self, alt, filename):
+    @given(doc=_image_docs)
+    def test_images_preserved(self, md_round_trip, doc):
         """For any markdown with images, images SHALL be preserved."""
-        parser = MarkdownParser()
-        
-        img_path = f"/images/{filename}.png"
-        content = f"See the diagram below:\n\n![{alt}]({img_path})\n\nAs shown above."
+        content, img_path = doc
         
-        blocks = parser.parse(content)
-        result = parser.reconstruct(blocks)
+        result = md_round_trip(content)
         
         # Image path should be preserved
         assert img_path in result, f"Image path not preserved: {img_path}"
@@ -109,25 +119,12 @@ class TestFrontmatterPreservation:
     **Validates: Requirements 1.5**
     """
     
-    @given(
-        title=st.text(alphabet="abcdefghijklmnopqrstuvwxyz ", min_size=3, max_size=30),
-        slug=st.text(alphabet="abcdefghijklmnopqrstuvwxyz-", min_size=3, max_size=20)
-    )
-    @settings(max_examples=100)
-    def test_frontmatter_structure_preserved(self, title, slug):
+    @given(doc=_frontmatter_docs)
+    def test_frontmatter_structure_preserved(self, md_round_trip, doc):
         """For any markdown with frontmatter, structure SHALL be preserved."""
-        parser = MarkdownParser()
-        
-        content = f"""---
-title: {title}
-slug: {slug}
----
-
-# Content here
-"""
+        content, slug = doc
         
-        blocks = parser.parse(content)
-        result = parser.reconstruct(blocks)
+        result = md_round_trip(content)
         
         # Frontmatter markers should be preserved
         assert result.startswith("---\n"), "Frontmatter start marker missing"
@@ -139,19 +136,17 @@ slug: {slug}
 class TestMarkdownParserUnit:
     """Unit tests for MarkdownParser."""
     
-    def test_parse_simple_markdown(self):
+    def test_parse_simple_markdown(self, md_parser):
         """Simple markdown should parse correctly."""
-        parser = MarkdownParser()
         content = "# Hello\n\nThis is a test."
         
-        blocks = parser.parse(content)
+        blocks = md_parser.parse(content)
         
         assert len(blocks) >= 1
         assert any(b.type == "text" for b in blocks)
     
-    def test_extract_frontmatter(self):
+    def test_extract_frontmatter(self, md_parser):
         """Frontmatter should be extracted correctly."""
-        parser = MarkdownParser()
         content = """---
 title: Test
 description: A test file
@@ -160,25 +155,23 @@ description: A test file
 # Content
 """
         
-        frontmatter, remaining = parser.extract_frontmatter(content)
+        frontmatter, remaining = md_parser.extract_frontmatter(content)
         
         assert frontmatter is not None
         assert frontmatter["title"] == "Test"
         assert "# Content" in remaining
     
-    def test_no_frontmatter(self):
+    def test_no_frontmatter(self, md_parser):
         """Content without frontmatter should work."""
-        parser = MarkdownParser()
         content = "# Just a heading\n\nSome text."
         
-        frontmatter, remaining = parser.extract_frontmatter(content)
+        frontmatter, remaining = md_parser.extract_frontmatter(content)
         
         assert frontmatter is None
         assert remaining == content
     
-    def test_multiple_code_blocks(self):
+    def test_multiple_code_blocks(self, md_parser):
         """Multiple code blocks should all be preserved."""
-        parser = MarkdownParser()
         content = """# Example
 
 ```python
@@ -193,18 +186,32 @@ console.log("World");
 ```
 """
         
-        blocks = parser.parse(content)
-        result = parser.reconstruct(blocks)
+        blocks = md_parser.parse(content)
+        result = md_parser.reconstruct(blocks)
         
         assert 'def hello():' in result
         assert 'console.log("World")' in result
     
-    def test_url_preservation(self):
+    def test_url_preservation(self, md_parser):
         """URLs should be preserved unchanged."""
-        parser = MarkdownParser()
         content = "Visit https://example.com/path?query=1 for more."
         
-        blocks = parser.parse(content)
-        result = parser.reconstruct(blocks)
+        blocks = md_parser.parse(content)
+        result = md_parser.reconstruct(blocks)
         
         assert "https://example.com/path?query=1" in result
+    
+    def test_update_translated_text_accepts_pairs(self, md_parser):
+        """Translations may be a dict or (index, text) pairs; bad indices are ignored."""
+        content = "# Title\n\nSome text."
+        
+        by_dict = md_parser.parse(content)
+        by_pairs = md_parser.parse(content)
+        segments = md_parser.get_translatable_text(by_pairs)
+        translated = [(idx, text.upper()) for idx, text in segments]
+        
+        md_parser.update_translated_text(by_dict, dict(translated))
+        md_parser.update_translated_text(by_pairs, translated + [(-1, "x"), (99, "x")])
+        
+        assert md_parser.reconstruct(by_pairs) == md_parser.reconstruct(by_dict)
+        assert "SOME TEXT." in md_parser.reconstruct(by_pairs)
@@ -1,8 +1,6 @@
 """Tests for MDXParser - Properties 5-6."""
 
-from hypothesis import given, strategies as st, settings
-
-from translatex.docs.mdx_parser import MDXParser
+from hypothesis import given, strategies as st
 
 
 class TestJSXComponentPreservation:
@@ -13,11 +11,9 @@ class TestJSXComponentPreservation:
     """
     
     @given(suffix=st.text(alphabet="abcdefghijklmnopqrstuvwxyz", min_size=2, max_size=8))
-    @settings(max_examples=50)
-    def test_self_closing_components_preserved(self, suffix):
+    def test_self_closing_components_preserved(self, mdx_round_trip, suffix):
         """For any MDX with self-closing components, components SHALL be preserved."""
         component_name = "My" + suffix.capitalize()
-        parser = MDXParser()
         
         content = f"""# Title
 
@@ -26,8 +22,7 @@ class TestJSXComponentPreservation:
 Some text after.
 """
         
-        blocks = parser.parse(content)
-        result = parser.reconstruct(blocks)
+        result = mdx_round_trip(content)
         
         # Component should be in result
         assert component_name in result, f"Component {component_name} not preserved"
@@ -41,11 +36,9 @@ class TestImportPreservation:
     **Validates: Requirements 2.3**
     """
     
-    @given(module=st.text(alphabet="abcdefghijklmnopqrstuvwxyz-", min_size=3, max_size=20))
-    @settings(max_examples=100)
-    def test_imports_preserved(self, module):
+    @given(module=st.text(alphabet="abcdefghijklmnopqrstuvwxyz-", min_size=3, max_size=10))
+    def test_imports_preserved(self, mdx_round_trip, module):
         """For any MDX with imports, imports SHALL be preserved."""
-        parser = MDXParser()
         
         content = f"""import Component from '{module}';
 
@@ -54,19 +47,17 @@ class TestImportPreservation:
 Some content here.
 """
         
-        blocks = parser.parse(content)
-        result = parser.reconstruct(blocks)
+        result = mdx_round_trip(content)
         
-        # Import should be preserved
-        assert f"import Component from '{module}'" in result, f"Import not preserved"
+        # Import should be preserved as the leading line
+        assert result.startswith(f"import Component from '{module}';\n"), "Import not preserved"
 
 
 class TestMDXParserUnit:
     """Unit tests for MDXParser."""
     
-    def test_parse_simple_mdx(self):
+    def test_parse_simple_mdx(self, mdx_parser):
         """Simple MDX should parse correctly."""
-        parser = MDXParser()
         content = """import { Button } from '@components';
 
 # Hello
@@ -74,29 +65,27 @@ class TestMDXParserUnit:
 <Button>Click me</Button>
 """
         
-        blocks = parser.parse(content)
+        blocks = mdx_parser.parse(content)
         
         assert len(blocks) >= 1
         # Should have import block
         assert any(b.type == "import" for b in blocks)
     
-    def test_extract_imports(self):
+    def test_extract_imports(self, mdx_parser):
         """Imports should be extracted correctly."""
-        parser = MDXParser()
         content = """import React from 'react';
 import { useState } from 'react';
 
 # Content
 """
         
-        imports = parser.extract_imports(content)
+        imports = mdx_parser.extract_imports(content)
         
         assert len(imports) >= 1
         assert any("react" in imp for imp in imports)
     
-    def test_preserve_jsx_expressions(self):
+    def test_preserve_jsx_expressions(self, mdx_parser):
         """JSX expressions should be preserved."""
-        parser = MDXParser()
         content = """# Title
 
 The value is {someVariable}.
@@ -104,14 +93,13 @@ The value is {someVariable}.
 More text.
 """
         
-        blocks = parser.parse(content)
-        result = parser.reconstruct(blocks)
+        blocks = mdx_parser.parse(content)
+        result = mdx_parser.reconstruct(blocks)
         
         assert "{someVariable}" in result
     
-    def test_component_with_content(self):
+    def test_component_with_content(self, mdx_parser):
         """Components with content should be preserved."""
-        parser = MDXParser()
         content = """# Title
 
 <Callout type="info">
@@ -121,16 +109,15 @@ This is important information.
 More text.
 """
         
-        blocks = parser.parse(content)
-        result = parser.reconstruct(blocks)
+        blocks = mdx_parser.parse(content)
+        result = mdx_parser.reconstruct(blocks)
         
         assert "<Callout" in result
         assert "</Callout>" in result
         assert 'type="info"' in result
     
-    def test_mixed_content(self):
+    def test_mixed_content(self, mdx_parser):
         """Mixed markdown and MDX should work."""
-        parser = MDXParser()
         content = """---
 title: Test
 ---
@@ -150,8 +137,8 @@ Important note here.
 </Card>
 """
         
-        blocks = parser.parse(content)
-        result = parser.reconstruct(blocks)
+        blocks = mdx_parser.parse(content)
+        result = mdx_parser.reconstruct(blocks)
         
         # All elements should be preserved
         assert "title: Test" in result
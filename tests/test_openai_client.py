@@ -3,11 +3,21 @@ Property-based tests for OpenAIClientManager
 Uses Hypothesis for property-based testing
 """
 import pytest
-from hypothesis import given, strategies as st, settings
 from translatex.utils.openai_client import OpenAIClientManager
 from translatex.utils.llm_client_factory import LLMClientFactory
 
 
+@pytest.fixture(scope="module", params=["openai", "openrouter", "groq"])
+def provider(request):
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def manager(provider, module_lightweight_openai):
+    """One client manager per provider (stub AsyncOpenAI), shared by the tests in this module."""
+    return OpenAIClientManager(api_key="test-api-key-12345", provider=provider)
+
+
 class TestAPIKeyFieldSelection:
     """
     **Feature: openrouter-support, Property 3: API key field selection**
@@ -16,22 +26,12 @@ class TestAPIKeyFieldSelection:
     **Validates: Requirements 2.1, 2.3**
     """
     
-    @given(provider=st.sampled_from(["openai", "openrouter", "groq"]))
-    @settings(max_examples=100, deadline=None)
-    def test_client_manager_uses_correct_provider(self, provider: str):
+    def test_client_manager_uses_correct_provider(self, provider: str, manager: OpenAIClientManager):
         """Property: ClientManager stores and returns correct provider"""
-        dummy_key = "test-api-key-12345"
-        manager = OpenAIClientManager(api_key=dummy_key, provider=provider)
-        
         assert manager.get_provider() == provider
     
-    @given(provider=st.sampled_from(["openai", "openrouter", "groq"]))
-    @settings(max_examples=100, deadline=None)
-    def test_client_manager_creates_valid_client(self, provider: str):
+    def test_client_manager_creates_valid_client(self, manager: OpenAIClientManager):
         """Property: ClientManager creates a valid client for any supported provider"""
-        dummy_key = "test-api-key-12345"
-        manager = OpenAIClientManager(api_key=dummy_key, provider=provider)
-        
         client = manager.get_client()
         assert client is not None
     
@@ -57,7 +57,7 @@ class TestAPIKeyFieldSelection:
         
         assert "Invalid provider" in str(exc_info.value)
     
-    def test_default_provider_is_openai(self):
+    def test_default_provider_is_openai(self, lightweight_openai):
         """Default provider should be openai"""
         manager = OpenAIClientManager(api_key="test-key")
         assert manager.get_provider() == "openai"
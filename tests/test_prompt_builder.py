@@ -2,11 +2,35 @@
 Property-based tests for PromptBuilder
 Uses Hypothesis for property-based testing
 """
+import functools
+import itertools
 import pytest
-from hypothesis import given, strategies as st, settings
+from hypothesis import given, strategies as st
 from translatex.utils.prompt_builder import PromptBuilder
 
 
+_LANGS = ("English", "Vietnamese", "French", "German", "Japanese")
+
+# Two independently built instances per language pair, constructed once
+_BUILDER_PAIRS = {
+    (a, b): (PromptBuilder(a, b), PromptBuilder(a, b))
+    for a, b in itertools.product(_LANGS, repeat=2)
+}
+
+
+@pytest.fixture(scope="module")
+def en_vi_builder():
+    """The English -> Vietnamese builder shared by single-pair tests."""
+    return _BUILDER_PAIRS[("English", "Vietnamese")][0]
+
+
+@functools.lru_cache(maxsize=None)
+def _system_prompts(source_lang: str, target_lang: str) -> tuple:
+    """System prompts of both builders for a pair (text-independent, so built once)."""
+    builder1, builder2 = _BUILDER_PAIRS[(source_lang, target_lang)]
+    return builder1.build_system_prompt(), builder2.build_system_prompt()
+
+
 class TestPromptConsistency:
     """
     **Feature: openrouter-support, Property 6: Prompt consistency across providers**
@@ -15,58 +39,49 @@ class TestPromptConsistency:
     """
     
     @given(
-        source_lang=st.sampled_from(["English", "Vietnamese", "French", "German", "Japanese"]),
-        target_lang=st.sampled_from(["English", "Vietnamese", "French", "German", "Japanese"]),
+        source_lang=st.sampled_from(_LANGS),
+        target_lang=st.sampled_from(_LANGS),
         text=st.text(min_size=1, max_size=1000)
     )
-    @settings(max_examples=100)
     def test_prompt_builder_generates_consistent_prompts(self, source_lang: str, target_lang: str, text: str):
         """Property: PromptBuilder generates identical prompts regardless of when called"""
-        builder1 = PromptBuilder(source_lang, target_lang)
-        builder2 = PromptBuilder(source_lang, target_lang)
+        builder1, builder2 = _BUILDER_PAIRS[(source_lang, target_lang)]
+        system1, system2 = _system_prompts(source_lang, target_lang)
         
         # Same inputs should produce same outputs
-        assert builder1.build_system_prompt() == builder2.build_system_prompt()
+        assert system1 == system2
         assert builder1.build_user_prompt(text) == builder2.build_user_prompt(text)
         assert builder1.build_messages(text) == builder2.build_messages(text)
     
-    @given(
-        source_lang=st.sampled_from(["English", "Vietnamese", "French"]),
-        target_lang=st.sampled_from(["English", "Vietnamese", "French"]),
-        text=st.text(min_size=1, max_size=500)
+    @pytest.mark.parametrize(
+        "source_lang,target_lang",
+        list(itertools.product(_LANGS[:3], repeat=2)),
     )
-    @settings(max_examples=100)
-    def test_system_prompt_contains_language_info(self, source_lang: str, target_lang: str, text: str):
+    def test_system_prompt_contains_language_info(self, source_lang: str, target_lang: str):
         """Property: System prompt always contains source and target language"""
-        builder = PromptBuilder(source_lang, target_lang)
-        system_prompt = builder.build_system_prompt()
+        system_prompt, _ = _system_prompts(source_lang, target_lang)
         
         assert source_lang in system_prompt
         assert target_lang in system_prompt
     
     @given(text=st.text(min_size=1, max_size=500))
-    @settings(max_examples=100)
-    def test_user_prompt_contains_input_text(self, text: str):
+    def test_user_prompt_contains_input_text(self, en_vi_builder, text: str):
         """Property: User prompt contains the input text"""
-        builder = PromptBuilder("English", "Vietnamese")
-        assert text in builder.build_user_prompt(text)
+        assert text in en_vi_builder.build_user_prompt(text)
     
     @given(text=st.text(min_size=1, max_size=500))
-    @settings(max_examples=100)
-    def test_messages_structure_is_correct(self, text: str):
+    def test_messages_structure_is_correct(self, en_vi_builder, text: str):
         """Property: Messages array has correct structure"""
-        builder = PromptBuilder("English", "Vietnamese")
-        messages = builder.build_messages(text)
+        messages = en_vi_builder.build_messages(text)
         
         assert len(messages) == 2
         assert messages[0]["role"] == "system"
         assert messages[1]["role"] == "user"
         assert text in messages[1]["content"]
     
-    def test_system_prompt_contains_marker_instructions(self):
+    def test_system_prompt_contains_marker_instructions(self, en_vi_builder):
         """System prompt should contain instructions about preserving markers"""
-        builder = PromptBuilder("English", "Vietnamese")
-        system_prompt = builder.build_system_prompt()
+        system_prompt = en_vi_builder.build_system_prompt()
         
         # Check for marker-related instructions
         assert "<R0>" in system_prompt or "marker" in system_prompt.lower()
@@ -1,6 +1,6 @@
 """Tests for RetryHandler - Property 7."""
 
-from hypothesis import given, strategies as st, settings
+from hypothesis import given, strategies as st
 
 from translatex.utils.retry import RetryHandler
 
@@ -16,7 +16,6 @@ class TestExponentialBackoffProperty:
         attempt1=st.integers(min_value=0, max_value=5),
         attempt2=st.integers(min_value=0, max_value=5)
     )
-    @settings(max_examples=100)
     def test_delay_increases_exponentially(self, attempt1, attempt2):
         """For any rate limit error, retry delay SHALL increase exponentially."""
         if attempt1 >= attempt2:
@@ -34,7 +33,6 @@ class TestExponentialBackoffProperty:
             f"Delay for attempt {attempt2} should be greater than attempt {attempt1}"
     
     @given(attempt=st.integers(min_value=0, max_value=10))
-    @settings(max_examples=100)
     def test_delay_respects_max_cap(self, attempt):
         """Delay should never exceed max_delay."""
         max_delay = 30.0
@@ -48,7 +46,6 @@ class TestExponentialBackoffProperty:
         base_delay=st.floats(min_value=0.1, max_value=5.0),
         exponential_base=st.floats(min_value=1.5, max_value=3.0)
     )
-    @settings(max_examples=100)
     def test_exponential_growth_pattern(self, base_delay, exponential_base):
         """Delay should follow exponential growth pattern."""
         handler = RetryHandler(
@@ -58,14 +55,10 @@ class TestExponentialBackoffProperty:
             exponential_base=exponential_base
         )
         
-        delays = []
-        for attempt in range(4):
-            # Get multiple samples and use minimum to account for jitter
-            samples = [handler.calculate_delay(attempt) for _ in range(10)]
-            delays.append(min(samples))
+        # Jitter-free delays, one call per attempt
+        delays = [handler._base_delay(attempt) for attempt in range(4)]
         
         # Each delay should be roughly exponential_base times the previous
-        # (allowing for jitter variance)
         for i in range(1, len(delays)):
             ratio = delays[i] / delays[i-1] if delays[i-1] > 0 else 0
             # Ratio should be close to exponential_base (within jitter tolerance)
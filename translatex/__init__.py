@@ -7,14 +7,20 @@ Author: Hoang Hong Huy
 Email: huy.hoanghong.work@gmail.com
 GitHub: https://github.com/hoanghonghuy
 """
-from .docxtranslator import DocxTranslator
-from .batch import BatchProcessor
-from .utils.cache import TranslationCache
-from .utils.checkpoint import CheckpointManager
-from .utils.context import ContextWindow
-from .utils.glossary import GlossaryLoader
-from .utils.review import ReviewGenerator
-from .utils.config import TranslateXConfig
+import importlib
+
+# Public names -> defining submodule; imported on first attribute access
+# (PEP 562) so `import translatex` doesn't pull in the docx pipeline.
+_LAZY = {
+    "DocxTranslator": ".docxtranslator",
+    "BatchProcessor": ".batch",
+    "TranslationCache": ".utils.cache",
+    "CheckpointManager": ".utils.checkpoint",
+    "ContextWindow": ".utils.context",
+    "GlossaryLoader": ".utils.glossary",
+    "ReviewGenerator": ".utils.review",
+    "TranslateXConfig": ".utils.config",
+}
 
 __version__ = "1.1.0"
 
@@ -28,3 +34,17 @@ __all__ = [
     "ReviewGenerator",
     "TranslateXConfig",
 ]
+
+
+def __getattr__(name):
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), *_LAZY])
@@ -1,5 +1,6 @@
 """Batch processing for multiple DOCX files."""
 
+import os
 from pathlib import Path
 from typing import Dict, List, Callable, Any
 from dataclasses import dataclass
@@ -8,7 +9,7 @@ from .utils.exceptions import BatchError
 from .utils.file_logger import get_logger
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchResult:
     """Result of batch processing."""
     file: str
@@ -18,7 +19,11 @@ class BatchResult:
 
 
 class BatchProcessor:
-    """Processes multiple DOCX files sequentially."""
+    """Processes multiple DOCX files sequentially.
+    
+    Concurrency across files lives in main.py (``batch_concurrency``), which
+    overlaps translators on one asyncio loop instead of using this class.
+    """
     
     def __init__(self, translator_factory: Callable, sequential: bool = True):
         """Initialize batch processor.
@@ -39,17 +44,23 @@ class BatchProcessor:
         Returns:
             List of .docx file paths
         """
-        path = Path(directory)
-        if not path.exists():
-            raise BatchError(f"Directory not found: {directory}")
-        if not path.is_dir():
+        if not os.path.isdir(directory):
+            if not os.path.exists(directory):
+                raise BatchError(f"Directory not found: {directory}")
             raise BatchError(f"Not a directory: {directory}")
         
-        docx_files = list(path.glob("*.docx"))
-        # Filter out temp files (start with ~$)
-        docx_files = [f for f in docx_files if not f.name.startswith("~$")]
+        # Single scandir pass; cheapest checks first, then skip hidden
+        # files and Word temp files (~$) before touching d_type
+        with os.scandir(directory) as it:
+            docx_files = [
+                entry.path for entry in it
+                if (name := entry.name)[-5:] == ".docx"
+                and name[0] != "."
+                and name[:2] != "~$"
+                and entry.is_file()
+            ]
         
-        return [str(f) for f in sorted(docx_files)]
+        return sorted(docx_files)
     
     def process(
         self,
@@ -80,30 +91,7 @@ class BatchProcessor:
                 on_progress(idx + 1, total, filename)
             
             logger.info(f"Processing [{idx + 1}/{total}]: {filename}")
-            
-            try:
-                # Create translator instance
-                translator = self.translator_factory()
-                
-                # Translate file
-                output_file = translator.translate(file_path, output_dir)
-                
-                results[file_path] = BatchResult(
-                    file=file_path,
-                    status="success",
-                    output_file=output_file
-                )
-                logger.info(f"Completed: {filename}")
-                
-            except Exception as e:
-                error_msg = str(e)
-                results[file_path] = BatchResult(
-                    file=file_path,
-                    status="failed",
-                    error=error_msg
-                )
-                logger.error(f"Failed: {filename} - {error_msg}")
-                # Continue with remaining files
+            results[file_path] = self._process_one(file_path, output_dir)
         
         # Log summary
         success_count = sum(1 for r in results.values() if r.status == "success")
@@ -113,6 +101,35 @@ class BatchProcessor:
         
         return results
     
+    def _process_one(self, file_path: str, output_dir: str = None) -> BatchResult:
+        """Translate one file; failures are captured in the result, not raised."""
+        logger = get_logger()
+        filename = Path(file_path).name
+        
+        try:
+            # Create translator instance
+            translator = self.translator_factory()
+            
+            # Translate file
+            output_file = translator.translate(file_path, output_dir)
+            
+            logger.info(f"Completed: {filename}")
+            return BatchResult(
+                file=file_path,
+                status="success",
+                output_file=output_file
+            )
+            
+        except Exception as e:
+            error_msg = str(e)
+            logger.error(f"Failed: {filename} - {error_msg}")
+            # Continue with remaining files
+            return BatchResult(
+                file=file_path,
+                status="failed",
+                error=error_msg
+            )
+    
     def get_summary(self, results: Dict[str, BatchResult]) -> Dict[str, Any]:
         """Get summary statistics from batch results.
         
@@ -1,18 +1,64 @@
 """Manifest manager for incremental documentation translation."""
 
-import json
+import os
+import sys
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+
+import orjson
+import xxhash
 
 from translatex.utils.file_logger import get_logger
 
 
+class _Entry(NamedTuple):
+    """In-memory manifest entry (a tuple, no per-entry dict or key strings)."""
+    source_hash: str
+    output_path: str
+    translated_at: str
+    source_mtime_ns: Optional[int] = None
+    source_size: Optional[int] = None
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "_Entry":
+        """Build an entry from its on-disk dict form."""
+        return cls(
+            data["source_hash"],
+            data["output_path"],
+            data["translated_at"],
+            data.get("source_mtime_ns"),
+            data.get("source_size"),
+        )
+    
+    def to_dict(self) -> dict:
+        """On-disk form; stat fields are omitted when unknown."""
+        data = {
+            "source_hash": self.source_hash,
+            "output_path": self.output_path,
+            "translated_at": self.translated_at
+        }
+        if self.source_mtime_ns is not None:
+            data["source_mtime_ns"] = self.source_mtime_ns
+            data["source_size"] = self.source_size
+        return data
+
+
 class ManifestManager:
-    """Manage translation manifest for incremental updates."""
+    """Manage translation manifest for incremental updates.
+    
+    In memory, ``manifest["files"]`` maps relative paths to ``_Entry``
+    tuples; they are expanded to dicts only by save() and the getters.
+    """
     
-    MANIFEST_VERSION = "1.0"
+    # 2.0: source_hash is xxh3-64 (was SHA-256); 1.0 manifests are migrated
+    MANIFEST_VERSION = "2.0"
+    LEGACY_VERSION = "1.0"
+    
+    # Read size for streaming file content into the hash
+    HASH_CHUNK_SIZE = 1 << 16
     
     def __init__(self, manifest_file: str):
         """Initialize manifest manager.
@@ -41,33 +87,97 @@ class ManifestManager:
             return False
         
         try:
-            with open(self.manifest_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(self.manifest_file, "rb") as f:
+                data = orjson.loads(f.read())
             
             # Validate version
-            if data.get("version") != self.MANIFEST_VERSION:
+            version = data.get("version")
+            if version == self.LEGACY_VERSION:
+                data = self._migrate_legacy(data)
+            elif version != self.MANIFEST_VERSION:
                 self.logger.warning("Manifest version mismatch, starting fresh")
                 return False
-            
+            else:
+                data["files"] = {
+                    sys.intern(relative_path): _Entry.from_dict(entry)
+                    for relative_path, entry in data["files"].items()
+                }
             self.manifest = data
             self.logger.info(f"Loaded manifest with {len(self.manifest['files'])} entries")
+            if version == self.LEGACY_VERSION:
+                self.save()
             return True
-        except (json.JSONDecodeError, IOError) as e:
+        except (orjson.JSONDecodeError, OSError, KeyError, TypeError, AttributeError) as e:
             self.logger.warning(f"Failed to load manifest: {e}")
             return False
     
+    def _migrate_legacy(self, data: dict) -> dict:
+        """Convert a 1.0 manifest (SHA-256 hashes) to the current format.
+        
+        Each source file is read once: if it still matches its recorded
+        SHA-256, the entry is kept with the file's xxh3 hash and stat;
+        otherwise the entry is dropped, so the file counts as changed.
+        
+        Args:
+            data: Parsed 1.0 manifest
+            
+        Returns:
+            Manifest dict with _Entry values and the current version
+        """
+        source_dir = Path(data.get("source_dir") or ".")
+        files = {}
+        for relative_path, entry in data["files"].items():
+            st, sha256, xxh3 = self._legacy_hashes(source_dir / relative_path)
+            if st is None or entry.get("source_hash") != sha256:
+                continue
+            files[sys.intern(relative_path)] = _Entry(
+                xxh3, entry["output_path"], entry["translated_at"], st.st_mtime_ns, st.st_size
+            )
+        
+        self.logger.info(
+            f"Migrated manifest {self.LEGACY_VERSION} -> {self.MANIFEST_VERSION}: "
+            f"kept {len(files)} of {len(data['files'])} entries"
+        )
+        data["version"] = self.MANIFEST_VERSION
+        data["files"] = files
+        return data
+    
+    @classmethod
+    def _legacy_hashes(cls, file_path: Path) -> Tuple[Optional[os.stat_result], str, str]:
+        """Stat a file and compute its SHA-256 (1.0) and xxh3 (2.0) hashes in one read."""
+        sha256 = hashlib.sha256()
+        xxh3 = xxhash.xxh3_64()
+        try:
+            with open(file_path, "rb") as f:
+                st = os.fstat(f.fileno())
+                for chunk in iter(lambda: f.read(cls.HASH_CHUNK_SIZE), b""):
+                    sha256.update(chunk)
+                    xxh3.update(chunk)
+        except OSError:
+            return None, "", ""
+        return st, sha256.hexdigest(), xxh3.hexdigest()
+    
     def save(self):
-        """Save manifest to file."""
+        """Save manifest to file (written to a temp file, then renamed)."""
         self.manifest["updated_at"] = datetime.now().isoformat()
         
         # Ensure parent directory exists
         self.manifest_file.parent.mkdir(parents=True, exist_ok=True)
         
+        manifest = dict(self.manifest)
+        manifest["files"] = {
+            relative_path: entry.to_dict()
+            for relative_path, entry in self.manifest["files"].items()
+        }
+        data = orjson.dumps(manifest, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        tmp = self.manifest_file.with_suffix(self.manifest_file.suffix + ".tmp")
         try:
-            with open(self.manifest_file, "w", encoding="utf-8") as f:
-                json.dump(self.manifest, f, ensure_ascii=False, indent=2)
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, self.manifest_file)
             self.logger.debug(f"Saved manifest to {self.manifest_file}")
-        except IOError as e:
+        except OSError as e:
+            tmp.unlink(missing_ok=True)
             self.logger.error(f"Failed to save manifest: {e}")
     
     def set_directories(self, source_dir: str, output_dir: str):
@@ -82,51 +192,138 @@ class ManifestManager:
         if not self.manifest["created_at"]:
             self.manifest["created_at"] = datetime.now().isoformat()
     
-    def get_file_hash(self, file_path: str) -> str:
-        """Calculate SHA256 hash of file content.
+    @classmethod
+    def hash_bytes(cls, data: bytes) -> str:
+        """Calculate xxh3-64 hash of in-memory content.
+        
+        Args:
+            data: Content bytes
+        
+        Returns:
+            Hash string (same as get_file_hash for a file with this content)
+        """
+        return xxhash.xxh3_64_hexdigest(data)
+    
+    @classmethod
+    def get_file_hash(cls, file_path: str) -> str:
+        """Calculate xxh3-64 hash of file content.
+        
+        Change detection only, not an integrity check, so a fast
+        non-cryptographic hash is enough.
         
         Args:
             file_path: Path to file
-            
+        
         Returns:
             Hash string
         """
+        return cls.stat_and_hash(file_path)[1]
+    
+    @classmethod
+    def stat_and_hash(cls, file_path: str) -> Tuple[Optional[os.stat_result], str]:
+        """Stat a file, then hash its content (see get_file_hash).
+        
+        The stat is taken before any content is read, so an edit made while
+        or after hashing always changes the recorded mtime. Pass both to
+        update() so a hash is never paired with a newer stat.
+        
+        Args:
+            file_path: Path to file
+        
+        Returns:
+            (stat result, hash string), or (None, "") if unreadable
+        """
+        h = xxhash.xxh3_64()
         try:
             with open(file_path, "rb") as f:
-                return hashlib.sha256(f.read()).hexdigest()
-        except IOError:
-            return ""
+                st = os.fstat(f.fileno())
+                # Streams through a fixed buffer instead of reading the whole file
+                for chunk in iter(lambda: f.read(cls.HASH_CHUNK_SIZE), b""):
+                    h.update(chunk)
+        except OSError:
+            return None, ""
+        return st, h.hexdigest()
     
     def is_changed(self, relative_path: str, source_path: str) -> bool:
         """Check if file has changed since last translation.
         
+        A matching recorded mtime and size skip hashing the file entirely.
+        
         Args:
             relative_path: Relative path (used as key)
             source_path: Absolute source path
-            
+        
         Returns:
             True if file is new or changed, False if unchanged
         """
+        try:
+            st = os.stat(source_path)
+        except OSError:
+            return True
+        
         entry = self.manifest["files"].get(relative_path)
         if not entry:
             return True  # New file
         
+        if entry.source_mtime_ns == st.st_mtime_ns and entry.source_size == st.st_size:
+            return False
+        
         current_hash = self.get_file_hash(source_path)
-        return entry.get("source_hash") != current_hash
+        if entry.source_hash != current_hash:
+            return True
+        
+        # Same content, new mtime (touch, checkout): record it so next run skips hashing
+        self.manifest["files"][relative_path] = entry._replace(
+            source_mtime_ns=st.st_mtime_ns, source_size=st.st_size
+        )
+        return False
     
-    def update(self, relative_path: str, source_hash: str, output_path: str):
+    def batch_is_changed(self, items: Iterable[Tuple[str, str]]) -> Dict[str, bool]:
+        """Check many files at once, hashing them in parallel.
+        
+        File reads and xxhash both release the GIL, so threads overlap the
+        I/O and hashing of different files.
+        
+        Args:
+            items: (relative_path, source_path) pairs
+            
+        Returns:
+            Dict mapping relative_path to is_changed() result
+        """
+        items = list(items)
+        if len(items) <= 1:
+            return {rel: self.is_changed(rel, src) for rel, src in items}
+        
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as pool:
+            results = pool.map(lambda item: self.is_changed(*item), items)
+            return dict(zip((rel for rel, _ in items), results))
+    
+    def update(self, relative_path: str, source_hash: str, output_path: str, stat_result: os.stat_result = None):
         """Update manifest entry for a file.
         
         Args:
             relative_path: Relative path (used as key)
             source_hash: Hash of source file
             output_path: Path to translated output file
+            stat_result: Source stat taken when source_hash was computed (see
+                stat_and_hash); without it the next check re-hashes the file
         """
-        self.manifest["files"][relative_path] = {
-            "source_hash": source_hash,
-            "output_path": output_path,
-            "translated_at": datetime.now().isoformat()
-        }
+        entry = _Entry(source_hash, output_path, datetime.now().isoformat())
+        if stat_result is not None:
+            entry = entry._replace(source_mtime_ns=stat_result.st_mtime_ns, source_size=stat_result.st_size)
+        self.manifest["files"][relative_path] = entry
+    
+    def bulk_update(self, entries: Iterable[Tuple[str, str, str]]):
+        """Update manifest entries for many files at once (no save).
+        
+        Args:
+            entries: (relative_path, source_hash, output_path) tuples
+        """
+        translated_at = datetime.now().isoformat()
+        self.manifest["files"].update(
+            (relative_path, _Entry(source_hash, output_path, translated_at))
+            for relative_path, source_hash, output_path in entries
+        )
     
     def remove(self, relative_path: str):
         """Remove a file entry from manifest.
@@ -141,11 +338,12 @@ class ManifestManager:
         
         Args:
             relative_path: Relative path
-            
+        
         Returns:
             Entry dict or None
         """
-        return self.manifest["files"].get(relative_path)
+        entry = self.manifest["files"].get(relative_path)
+        return entry.to_dict() if entry else None
     
     def get_all_entries(self) -> dict:
         """Get all file entries.
@@ -153,7 +351,10 @@ class ManifestManager:
         Returns:
             Dict of all file entries
         """
-        return self.manifest["files"].copy()
+        return {
+            relative_path: entry.to_dict()
+            for relative_path, entry in self.manifest["files"].items()
+        }
     
     def get_stats(self) -> dict:
         """Get manifest statistics.
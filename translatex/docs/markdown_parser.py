@@ -2,11 +2,15 @@
 
 import re
 from dataclasses import dataclass, field
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Union
 import yaml
 
+# libyaml's C loader/dumper when PyYAML was built with it (same output, much faster)
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
-@dataclass
+
+@dataclass(slots=True)
 class ContentBlock:
     """A block of content in a markdown file."""
     type: str  # "text", "code", "frontmatter", "html", "link", "image"
@@ -30,8 +34,9 @@ class MarkdownParser:
     INLINE_CODE_PATTERN = re.compile(r'`([^`]+)`')
     LINK_PATTERN = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
     IMAGE_PATTERN = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
-    URL_PATTERN = re.compile(r'https?://[^\s<>\[\]()]+')
+    URL_PATTERN = re.compile(r'(https?://[^\s<>\[\]()]+)')
     HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+    PLACEHOLDER_PATTERN = re.compile(r'__(IMAGE|LINK|URL|INLINE_CODE|CODE_BLOCK)_(\d+)__')
     
     # Fields in frontmatter that should be translated
     TRANSLATABLE_FRONTMATTER_FIELDS = ["title", "description", "summary", "excerpt"]
@@ -58,9 +63,10 @@ class MarkdownParser:
         # Extract frontmatter first
         frontmatter, content = self.extract_frontmatter(content)
         if frontmatter:
+            # YAML is rendered from "parsed" at reconstruct() time
             blocks.append(ContentBlock(
                 type="frontmatter",
-                content=yaml.dump(frontmatter, allow_unicode=True, default_flow_style=False),
+                content="",
                 translatable=False,
                 metadata={"parsed": frontmatter}
             ))
@@ -71,61 +77,47 @@ class MarkdownParser:
         return blocks
     
     def _parse_content(self, content: str) -> List[ContentBlock]:
-        """Parse content into blocks, preserving code and special elements."""
+        """Parse content into blocks, preserving code and special elements.
+        
+        Each pass splits on its pattern and joins once with placeholders.
+        Code and link/image passes are skipped when the content has no
+        backtick or "[" (a single-char scan). The passes stay sequential
+        because later patterns match earlier placeholders (e.g. badge images
+        nested inside links).
+        """
         blocks = []
+        split = self._split_matches
         
         # Replace code blocks with placeholders
         code_blocks = []
-        def save_code_block(match):
-            lang = match.group(1) or ""
-            code = match.group(2)
-            placeholder = f"__CODE_BLOCK_{len(code_blocks)}__"
-            code_blocks.append((lang, code))
-            return placeholder
-        
-        content = self.CODE_BLOCK_PATTERN.sub(save_code_block, content)
+        if "`" in content:
+            texts, matches = split(self.CODE_BLOCK_PATTERN, content)
+            code_blocks = [(lang or "", code) for lang, code in matches]
+            content = self._join_matches(texts, [f"__CODE_BLOCK_{i}__" for i in range(len(matches))])
         
         # Replace inline code with placeholders
         inline_codes = []
-        def save_inline_code(match):
-            code = match.group(1)
-            placeholder = f"__INLINE_CODE_{len(inline_codes)}__"
-            inline_codes.append(code)
-            return placeholder
-        
-        content = self.INLINE_CODE_PATTERN.sub(save_inline_code, content)
+        if "`" in content:
+            texts, matches = split(self.INLINE_CODE_PATTERN, content)
+            inline_codes = [code for (code,) in matches]
+            content = self._join_matches(texts, [f"__INLINE_CODE_{i}__" for i in range(len(matches))])
         
         # Replace URLs with placeholders
-        urls = []
-        def save_url(match):
-            url = match.group(0)
-            placeholder = f"__URL_{len(urls)}__"
-            urls.append(url)
-            return placeholder
-        
-        content = self.URL_PATTERN.sub(save_url, content)
+        texts, matches = split(self.URL_PATTERN, content)
+        urls = [url for (url,) in matches]
+        content = self._join_matches(texts, [f"__URL_{i}__" for i in range(len(matches))])
         
         # Replace links with placeholders (preserve link text for translation)
         links = []
-        def save_link(match):
-            text = match.group(1)
-            url = match.group(2)
-            placeholder = f"__LINK_{len(links)}__"
-            links.append((text, url))
-            return f"[{text}]({placeholder})"
-        
-        content = self.LINK_PATTERN.sub(save_link, content)
+        if "[" in content:
+            texts, links = split(self.LINK_PATTERN, content)
+            content = self._join_matches(texts, [f"[{text}](__LINK_{i}__)" for i, (text, _) in enumerate(links)])
         
         # Replace images with placeholders
         images = []
-        def save_image(match):
-            alt = match.group(1)
-            url = match.group(2)
-            placeholder = f"__IMAGE_{len(images)}__"
-            images.append((alt, url))
-            return placeholder
-        
-        content = self.IMAGE_PATTERN.sub(save_image, content)
+        if "[" in content:
+            texts, images = split(self.IMAGE_PATTERN, content)
+            content = self._join_matches(texts, [f"__IMAGE_{i}__" for i in range(len(images))])
         
         # Create text block with metadata for reconstruction
         blocks.append(ContentBlock(
@@ -143,6 +135,28 @@ class MarkdownParser:
         
         return blocks
     
+    @staticmethod
+    def _split_matches(pattern: re.Pattern, content: str) -> Tuple[List[str], List[tuple]]:
+        """Split content on pattern in C (no per-match Python callback).
+        
+        Returns:
+            Tuple of (texts around the matches, group tuple per match)
+        """
+        pieces = pattern.split(content)
+        stride = pattern.groups + 1
+        groups = [pieces[g::stride] for g in range(1, stride)]
+        return pieces[::stride], list(zip(*groups))
+    
+    @staticmethod
+    def _join_matches(texts: List[str], replacements: List[str]) -> str:
+        """Interleave texts with one replacement per match and join once."""
+        if not replacements:
+            return texts[0]
+        parts = [None] * (len(texts) + len(replacements))
+        parts[::2] = texts
+        parts[1::2] = replacements
+        return "".join(parts)
+    
     def reconstruct(self, blocks: List[ContentBlock]) -> str:
         """Reconstruct markdown from content blocks.
         
@@ -156,32 +170,9 @@ class MarkdownParser:
         
         for block in blocks:
             if block.type == "frontmatter":
-                parts.append(f"---\n{block.content}---\n\n")
+                parts.append(f"---\n{self._format_frontmatter(block.metadata['parsed'])}---\n\n")
             elif block.type == "text":
-                content = block.content
-                metadata = block.metadata
-                
-                # Restore images
-                for i, (alt, url) in enumerate(metadata.get("images", [])):
-                    content = content.replace(f"__IMAGE_{i}__", f"![{alt}]({url})")
-                
-                # Restore links
-                for i, (text, url) in enumerate(metadata.get("links", [])):
-                    content = content.replace(f"__LINK_{i}__", url)
-                
-                # Restore URLs
-                for i, url in enumerate(metadata.get("urls", [])):
-                    content = content.replace(f"__URL_{i}__", url)
-                
-                # Restore inline code
-                for i, code in enumerate(metadata.get("inline_codes", [])):
-                    content = content.replace(f"__INLINE_CODE_{i}__", f"`{code}`")
-                
-                # Restore code blocks
-                for i, (lang, code) in enumerate(metadata.get("code_blocks", [])):
-                    content = content.replace(f"__CODE_BLOCK_{i}__", f"```{lang}\n{code}```")
-                
-                parts.append(content)
+                parts.append(self._restore_placeholders(block.content, block.metadata))
             elif block.type == "code":
                 lang = block.language or ""
                 parts.append(f"```{lang}\n{block.content}```")
@@ -190,6 +181,47 @@ class MarkdownParser:
         
         return "".join(parts)
     
+    def _format_frontmatter(self, frontmatter: dict) -> str:
+        """Format frontmatter dict back to YAML string."""
+        return yaml.dump(frontmatter, Dumper=YAML_DUMPER, allow_unicode=True, default_flow_style=False)
+    
+    def _placeholder_renderers(self, metadata: dict) -> dict:
+        """Map placeholder kind -> (saved values, render function), in restore order."""
+        return {
+            "IMAGE": (metadata.get("images", []), lambda v: f"![{v[0]}]({v[1]})"),
+            "LINK": (metadata.get("links", []), lambda v: v[1]),
+            "URL": (metadata.get("urls", []), lambda v: v),
+            "INLINE_CODE": (metadata.get("inline_codes", []), lambda v: f"`{v}`"),
+            "CODE_BLOCK": (metadata.get("code_blocks", []), lambda v: f"```{v[0]}\n{v[1]}```"),
+        }
+    
+    def _restore_placeholders(self, content: str, metadata: dict) -> str:
+        """Restore all placeholders in one PLACEHOLDER_PATTERN pass.
+        
+        A restored value can itself hold placeholders of kinds restored after
+        its own (an image URL saved as ``__LINK_n__``, a link URL as
+        ``__URL_n__``), so those are resolved recursively, matching the old
+        one-kind-at-a-time replace order.
+        """
+        renderers = self._placeholder_renderers(metadata)
+        rank = {kind: i for i, kind in enumerate(renderers)}
+        pattern = self.PLACEHOLDER_PATTERN
+        
+        def restore(text: str, after: int) -> str:
+            def sub(match):
+                kind = match.group(1)
+                values, render = renderers[kind]
+                i = int(match.group(2))
+                if rank[kind] <= after or i >= len(values):
+                    return match.group(0)
+                value = render(values[i])
+                return restore(value, rank[kind]) if "__" in value else value
+            return pattern.sub(sub, text)
+        
+        if "__" not in content:
+            return content
+        return restore(content, -1)
+    
     def extract_frontmatter(self, content: str) -> Tuple[Optional[dict], str]:
         """Extract YAML frontmatter from content.
         
@@ -199,12 +231,16 @@ class MarkdownParser:
         Returns:
             Tuple of (frontmatter dict or None, remaining content)
         """
+        # Most files have no frontmatter: skip the regex unless it can match
+        if not content.startswith("---"):
+            return None, content
+        
         match = self.FRONTMATTER_PATTERN.match(content)
         if not match:
             return None, content
         
         try:
-            frontmatter = yaml.safe_load(match.group(1))
+            frontmatter = yaml.load(match.group(1), Loader=YAML_LOADER)
             remaining = content[match.end():]
             return frontmatter, remaining
         except yaml.YAMLError:
@@ -221,21 +257,30 @@ class MarkdownParser:
         """
         segments = []
         for i, block in enumerate(blocks):
-            if block.translatable and block.content.strip():
+            # isspace() stops at the first non-space char, strip() copies the block
+            if block.translatable and block.content and not block.content.isspace():
                 segments.append((i, block.content))
         return segments
     
-    def update_translated_text(self, blocks: List[ContentBlock], translations: dict) -> List[ContentBlock]:
+    def update_translated_text(
+        self,
+        blocks: List[ContentBlock],
+        translations: Union[Dict[int, str], List[Tuple[int, str]]]
+    ) -> List[ContentBlock]:
         """Update blocks with translated text.
         
         Args:
             blocks: Original content blocks
-            translations: Dict mapping block_index to translated text
+            translations: Dict mapping block_index to translated text, or
+                (block_index, text) pairs as returned by get_translatable_text
             
         Returns:
-            Updated content blocks
+            Updated content blocks (out-of-range indices are ignored)
         """
-        for idx, translated in translations.items():
-            if 0 <= idx < len(blocks):
+        items = translations.items() if isinstance(translations, dict) else translations
+        count = len(blocks)
+        for idx, translated in items:
+            # Negative indices would silently hit blocks from the end, keep the check
+            if 0 <= idx < count:
                 blocks[idx].content = translated
         return blocks
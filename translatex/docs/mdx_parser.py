@@ -31,6 +31,10 @@ class MDXParser(MarkdownParser):
     # JSX expression pattern
     JSX_EXPRESSION = re.compile(r'\{[^{}]*\}')
     
+    PLACEHOLDER_PATTERN = re.compile(
+        r'__(JSX_EXPR|COMPONENT|IMAGE|LINK|URL|INLINE_CODE|CODE_BLOCK)_(\d+)__'
+    )
+    
     def parse(self, content: str) -> List[ContentBlock]:
         """Parse MDX into content blocks.
         
@@ -47,7 +51,7 @@ class MDXParser(MarkdownParser):
         if frontmatter:
             blocks.append(ContentBlock(
                 type="frontmatter",
-                content=self._format_frontmatter(frontmatter),
+                content="",
                 translatable=False,
                 metadata={"parsed": frontmatter}
             ))
@@ -80,11 +84,6 @@ class MDXParser(MarkdownParser):
         
         return blocks
     
-    def _format_frontmatter(self, frontmatter: dict) -> str:
-        """Format frontmatter dict back to YAML string."""
-        import yaml
-        return yaml.dump(frontmatter, allow_unicode=True, default_flow_style=False)
-    
     def _parse_mdx_content(self, content: str) -> List[ContentBlock]:
         """Parse MDX content with JSX component handling."""
         blocks = []
@@ -167,53 +166,33 @@ class MDXParser(MarkdownParser):
         
         for block in blocks:
             if block.type == "frontmatter":
-                parts.append(f"---\n{block.content}---\n\n")
+                parts.append(f"---\n{self._format_frontmatter(block.metadata['parsed'])}---\n\n")
             elif block.type == "import":
                 parts.append(block.content + "\n\n")
             elif block.type == "export":
                 parts.append(block.content + "\n\n")
             elif block.type == "text":
-                content = block.content
-                metadata = block.metadata
-                
-                # Restore JSX expressions
-                for i, expr in enumerate(metadata.get("jsx_expressions", [])):
-                    content = content.replace(f"__JSX_EXPR_{i}__", expr)
-                
-                # Restore components
-                for i, comp in enumerate(metadata.get("components", [])):
-                    if comp.self_closing:
-                        replacement = f"<{comp.name} {comp.props}/>" if comp.props else f"<{comp.name} />"
-                    else:
-                        replacement = f"<{comp.name} {comp.props}>{comp.content}</{comp.name}>" if comp.props else f"<{comp.name}>{comp.content}</{comp.name}>"
-                    content = content.replace(f"__COMPONENT_{i}__", replacement)
-                
-                # Restore images
-                for i, (alt, url) in enumerate(metadata.get("images", [])):
-                    content = content.replace(f"__IMAGE_{i}__", f"![{alt}]({url})")
-                
-                # Restore links
-                for i, (text, url) in enumerate(metadata.get("links", [])):
-                    content = content.replace(f"__LINK_{i}__", url)
-                
-                # Restore URLs
-                for i, url in enumerate(metadata.get("urls", [])):
-                    content = content.replace(f"__URL_{i}__", url)
-                
-                # Restore inline code
-                for i, code in enumerate(metadata.get("inline_codes", [])):
-                    content = content.replace(f"__INLINE_CODE_{i}__", f"`{code}`")
-                
-                # Restore code blocks
-                for i, (lang, code) in enumerate(metadata.get("code_blocks", [])):
-                    content = content.replace(f"__CODE_BLOCK_{i}__", f"```{lang}\n{code}```")
-                
-                parts.append(content)
+                parts.append(self._restore_placeholders(block.content, block.metadata))
             else:
                 parts.append(block.content)
         
         return "".join(parts)
     
+    def _placeholder_renderers(self, metadata: dict) -> dict:
+        """JSX expressions and components restore before the markdown kinds."""
+        def render_component(comp: ComponentBlock) -> str:
+            if comp.self_closing:
+                return f"<{comp.name} {comp.props}/>" if comp.props else f"<{comp.name} />"
+            if comp.props:
+                return f"<{comp.name} {comp.props}>{comp.content}</{comp.name}>"
+            return f"<{comp.name}>{comp.content}</{comp.name}>"
+        
+        return {
+            "JSX_EXPR": (metadata.get("jsx_expressions", []), lambda v: v),
+            "COMPONENT": (metadata.get("components", []), render_component),
+            **super()._placeholder_renderers(metadata),
+        }
+    
     def extract_imports(self, content: str) -> List[str]:
         """Extract import statements from MDX content.
         
@@ -2,14 +2,31 @@
 
 import os
 import shutil
-import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from dataclasses import dataclass
-from typing import List, Set
+from dataclasses import dataclass, field
+from typing import List, Optional, Set, Tuple
 
+from translatex.docs.manifest import ManifestManager
 from translatex.utils.file_logger import get_logger
 
 
+# mkdir/open(dir_fd=...) are POSIX-only
+_HAVE_DIR_FD = (
+    os.mkdir in os.supports_dir_fd
+    and os.open in os.supports_dir_fd
+)
+
+# Suffix -> DocFile.file_type for translatable files
+_DOC_TYPES = {".md": "md", ".mdx": "mdx"}
+
+
+def _file_ext(name: str) -> str:
+    """Return the lower-cased suffix of a file name ("" if none), like Path.suffix."""
+    dot = name.rfind(".")
+    return name[dot:].lower() if dot > 0 else ""
+
+
 @dataclass
 class DocFile:
     """A documentation file to be translated."""
@@ -18,39 +35,54 @@ class DocFile:
     output_path: str
     file_type: str  # "md" or "mdx"
     source_hash: str = ""
+    # Stat taken together with source_hash, for ManifestManager.update()
+    source_stat: Optional[os.stat_result] = field(default=None, repr=False, compare=False)
     
     def __post_init__(self):
         if not self.source_hash:
-            self.source_hash = self._calculate_hash()
+            self.source_stat, self.source_hash = self._calculate_hash()
     
-    def _calculate_hash(self) -> str:
-        """Calculate SHA256 hash of file content."""
-        try:
-            with open(self.source_path, "rb") as f:
-                return hashlib.sha256(f.read()).hexdigest()
-        except IOError:
-            return ""
+    def _calculate_hash(self) -> Tuple[Optional[os.stat_result], str]:
+        """Stat and hash file content (the manifest's change-detection hash)."""
+        return ManifestManager.stat_and_hash(self.source_path)
+
+
+def _hash_files(paths: List[str]) -> List[Tuple[Optional[os.stat_result], str]]:
+    """Stat and hash files on a thread pool (reads and xxhash release the GIL).
+    
+    Each worker hashes one contiguous slice rather than one file per task,
+    so small files don't pay per-future overhead; order is preserved.
+    """
+    workers = min(32, (os.cpu_count() or 1) * 4, len(paths))
+    if workers <= 1:
+        return [ManifestManager.stat_and_hash(path) for path in paths]
+    
+    size = -(-len(paths) // workers)
+    chunks = [paths[i:i + size] for i in range(0, len(paths), size)]
+    with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+        results = executor.map(lambda chunk: [ManifestManager.stat_and_hash(path) for path in chunk], chunks)
+        return [result for chunk in results for result in chunk]
 
 
 class DocsScanner:
     """Scan documentation directories for markdown files."""
     
     # File extensions to translate
-    TRANSLATABLE_EXTENSIONS = {".md", ".mdx"}
+    TRANSLATABLE_EXTENSIONS = frozenset({".md", ".mdx"})
     
     # Extensions to copy without translation
-    ASSET_EXTENSIONS = {
+    ASSET_EXTENSIONS = frozenset({
         ".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp",  # Images
         ".json", ".yaml", ".yml", ".toml",  # Config
         ".css", ".scss", ".less",  # Styles
         ".js", ".ts", ".jsx", ".tsx",  # Scripts (in docs context, usually examples)
-    }
+    })
     
-    # Directories to skip
-    SKIP_DIRS = {
+    # Directories to skip (frozenset: O(1) literal membership, no pattern matching)
+    SKIP_DIRS = frozenset({
         "node_modules", ".git", ".github", "__pycache__",
         ".next", ".nuxt", "dist", "build", ".cache"
-    }
+    })
     
     def __init__(self, source_dir: str, output_dir: str):
         """Initialize scanner.
@@ -62,10 +94,82 @@ class DocsScanner:
         self.source_dir = Path(source_dir).resolve()
         self.output_dir = Path(output_dir).resolve()
         self.logger = get_logger()
+        
+        # Precomputed prefixes: hot loops build paths by concatenation/slicing
+        # instead of os.path.join / Path objects
+        self._sep = os.sep
+        self._src_prefix = str(self.source_dir).rstrip(os.sep) + os.sep
+        self._out_prefix = str(self.output_dir).rstrip(os.sep) + os.sep
+        
+        # Result of the last source walk, shared by scan/copy_assets/etc.
+        self._tree_cache: Optional[List[Tuple[str, List[str], List[str]]]] = None
+    
+    def _walk(self):
+        """Walk the source tree with os.scandir, pruning SKIP_DIRS.
+        
+        Each directory is read with a single scandir call, so entry types
+        come from the cached dirent data instead of extra stat() calls.
+        
+        Yields:
+            Tuples of (relative_dir, subdir_names, file_names), where
+            relative_dir is "" for the source root
+        """
+        root = str(self.source_dir)
+        src_prefix = self._src_prefix
+        sep = self._sep
+        skip_dirs = self.SKIP_DIRS
+        stack = [""]
+        
+        while stack:
+            rel_dir = stack.pop()
+            subdirs = []
+            file_names = []
+            descend = []
+            
+            try:
+                with os.scandir(src_prefix + rel_dir if rel_dir else root) as it:
+                    for entry in it:
+                        name = entry.name
+                        if entry.is_dir():
+                            if name in skip_dirs:
+                                continue
+                            subdirs.append(name)
+                            # Like os.walk, list symlinked dirs but don't follow them
+                            if not entry.is_symlink():
+                                descend.append(rel_dir + sep + name if rel_dir else name)
+                        else:
+                            file_names.append(name)
+            except OSError as e:
+                self.logger.warning(f"Cannot read directory {rel_dir or root}: {e}")
+                continue
+            
+            yield rel_dir, subdirs, file_names
+            
+            # Reverse so directories are visited in listing order (depth-first)
+            stack.extend(reversed(descend))
+    
+    def _tree(self, refresh: bool = False) -> List[Tuple[str, List[str], List[str]]]:
+        """Return the (cached) walk of the source tree.
+        
+        A full run calls scan(), ensure_output_structure() and copy_assets()
+        in turn; they all reuse one walk instead of each reading every
+        directory again.
+        
+        Args:
+            refresh: Walk again even if a cached result exists
+            
+        Returns:
+            List of _walk() tuples, parents before their subdirectories
+        """
+        if refresh or self._tree_cache is None:
+            self._tree_cache = list(self._walk())
+        return self._tree_cache
     
     def scan(self) -> List[DocFile]:
         """Recursively find all .md and .mdx files.
         
+        Always re-walks the source tree and refreshes the cached walk.
+        
         Returns:
             List of DocFile objects
         """
@@ -75,24 +179,29 @@ class DocsScanner:
             self.logger.error(f"Source directory not found: {self.source_dir}")
             return files
         
-        for root, dirs, filenames in os.walk(self.source_dir):
-            # Skip certain directories
-            dirs[:] = [d for d in dirs if d not in self.SKIP_DIRS]
-            
-            for filename in filenames:
-                source_path = Path(root) / filename
-                ext = source_path.suffix.lower()
-                
-                if ext in self.TRANSLATABLE_EXTENSIONS:
-                    relative = source_path.relative_to(self.source_dir)
-                    output_path = self.output_dir / relative
-                    
-                    files.append(DocFile(
-                        source_path=str(source_path),
-                        relative_path=str(relative),
-                        output_path=str(output_path),
-                        file_type=ext[1:]  # Remove the dot
-                    ))
+        sep = self._sep
+        source_prefix = self._src_prefix
+        output_prefix = self._out_prefix
+        
+        found = []  # (relative_path, file_type)
+        for rel_dir, _, file_names in self._tree(refresh=True):
+            for filename in file_names:
+                file_type = _DOC_TYPES.get(_file_ext(filename))
+                if file_type:
+                    found.append((rel_dir + sep + filename if rel_dir else filename, file_type))
+        
+        # DocFile skips its own hashing when source_hash is given
+        hashes = _hash_files([source_prefix + relative for relative, _ in found])
+        
+        for (relative, file_type), (source_stat, source_hash) in zip(found, hashes):
+            files.append(DocFile(
+                source_path=source_prefix + relative,
+                relative_path=relative,
+                output_path=output_prefix + relative,
+                file_type=file_type,
+                source_hash=source_hash,
+                source_stat=source_stat
+            ))
         
         self.logger.info(f"Found {len(files)} documentation files")
         return files
@@ -102,10 +211,12 @@ class DocsScanner:
         
         Args:
             file_path: Absolute file path
-            
+        
         Returns:
             Relative path string
         """
+        if file_path.startswith(self._src_prefix):
+            return file_path[len(self._src_prefix):]
         return str(Path(file_path).relative_to(self.source_dir))
     
     def get_output_path(self, file_path: str) -> str:
@@ -113,59 +224,111 @@ class DocsScanner:
         
         Args:
             file_path: Source file path
-            
+        
         Returns:
             Output file path
         """
-        relative = self.get_relative_path(file_path)
-        return str(self.output_dir / relative)
+        return self._out_prefix + self.get_relative_path(file_path)
     
     def copy_assets(self, extensions: Set[str] = None) -> int:
         """Copy non-translatable files to output directory.
         
         Args:
             extensions: Set of extensions to copy (default: ASSET_EXTENSIONS)
-            
+        
         Returns:
             Number of files copied
         """
         extensions = extensions or self.ASSET_EXTENSIONS
-        copied = 0
+        sep = self._sep
+        source_prefix = self._src_prefix
+        output_prefix = self._out_prefix
         
-        for root, dirs, filenames in os.walk(self.source_dir):
-            dirs[:] = [d for d in dirs if d not in self.SKIP_DIRS]
-            
-            for filename in filenames:
-                source_path = Path(root) / filename
-                ext = source_path.suffix.lower()
-                
-                if ext in extensions:
-                    relative = source_path.relative_to(self.source_dir)
-                    output_path = self.output_dir / relative
-                    
-                    # Create parent directories
-                    output_path.parent.mkdir(parents=True, exist_ok=True)
-                    
-                    # Copy file
-                    try:
-                        shutil.copy2(source_path, output_path)
-                        copied += 1
-                    except IOError as e:
-                        self.logger.warning(f"Failed to copy {source_path}: {e}")
+        # Collect first, then copy in parallel (I/O-bound)
+        assets = []
+        for rel_dir, _, file_names in self._tree():
+            for filename in file_names:
+                if _file_ext(filename) in extensions:
+                    assets.append(rel_dir + sep + filename if rel_dir else filename)
+        
+        # Create parent directories once per directory rather than per file
+        for parent in {os.path.dirname(output_prefix + relative) for relative in assets}:
+            os.makedirs(parent, exist_ok=True)
+        
+        def copy_one(relative: str) -> bool:
+            # copy2 -> copyfile uses os.sendfile on Linux (kernel-side copy)
+            try:
+                shutil.copy2(source_prefix + relative, output_prefix + relative)
+                return True
+            except OSError as e:
+                self.logger.warning(f"Failed to copy {source_prefix + relative}: {e}")
+                return False
+        
+        copied = 0
+        if assets:
+            with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+                copied = sum(executor.map(copy_one, assets))
         
         self.logger.info(f"Copied {copied} asset files")
         return copied
     
     def ensure_output_structure(self):
-        """Create output directory structure mirroring source."""
-        for root, dirs, _ in os.walk(self.source_dir):
-            dirs[:] = [d for d in dirs if d not in self.SKIP_DIRS]
-            
-            for dir_name in dirs:
-                source_dir = Path(root) / dir_name
-                relative = source_dir.relative_to(self.source_dir)
-                output_dir = self.output_dir / relative
-                output_dir.mkdir(parents=True, exist_ok=True)
+        """Create output directory structure mirroring source.
+        
+        Where supported (POSIX), each mirror directory is created with
+        mkdir(dir_fd=...) relative to an open descriptor of its output
+        parent, so the kernel resolves one path component per mkdir instead
+        of the whole output path.
+        """
+        if _HAVE_DIR_FD:
+            self._ensure_output_structure_fd()
+            return
+        
+        sep = self._sep
+        output_prefix = self._out_prefix
+        
+        for rel_dir, subdirs, _ in self._tree():
+            dir_prefix = output_prefix + rel_dir + sep if rel_dir else output_prefix
+            for dir_name in subdirs:
+                os.makedirs(dir_prefix + dir_name, exist_ok=True)
+    
+    def _ensure_output_structure_fd(self):
+        """dir_fd-based ensure_output_structure keeping output dir fds open.
+        
+        Only descriptors along the current path are held (a stack), so the
+        number of open fds is bounded by tree depth, not tree width.
+        """
+        sep = self._sep
+        flags = os.O_RDONLY | os.O_DIRECTORY
+        stack = []  # (relative_dir, output fd) along the current path
+        
+        # A missing source root walks to nothing: create no output either
+        tree = self._tree()
+        if not tree:
+            return
+        
+        try:
+            # The walk is depth-first with parents first, like os.fwalk
+            for rel_dir, subdirs, _ in tree:
+                if rel_dir:
+                    parent, _, name = rel_dir.rpartition(sep)
+                    # Close descriptors of finished sibling subtrees
+                    while stack[-1][0] != parent:
+                        os.close(stack.pop()[1])
+                    out_fd = os.open(name, flags, dir_fd=stack[-1][1])
+                else:
+                    os.makedirs(self.output_dir, exist_ok=True)
+                    out_fd = os.open(self.output_dir, flags)
+                stack.append((rel_dir, out_fd))
+                
+                for dir_name in subdirs:
+                    try:
+                        os.mkdir(dir_name, dir_fd=out_fd)
+                    except FileExistsError:
+                        pass
+        finally:
+            for _, fd in stack:
+                os.close(fd)
     
     def get_stats(self) -> dict:
         """Get statistics about the documentation directory.
@@ -175,15 +338,12 @@ class DocsScanner:
         """
         stats = {"md": 0, "mdx": 0, "assets": 0, "other": 0}
         
-        for root, dirs, filenames in os.walk(self.source_dir):
-            dirs[:] = [d for d in dirs if d not in self.SKIP_DIRS]
-            
-            for filename in filenames:
-                ext = Path(filename).suffix.lower()
-                if ext == ".md":
-                    stats["md"] += 1
-                elif ext == ".mdx":
-                    stats["mdx"] += 1
+        for _, _, file_names in self._tree():
+            for filename in file_names:
+                ext = _file_ext(filename)
+                file_type = _DOC_TYPES.get(ext)
+                if file_type:
+                    stats[file_type] += 1
                 elif ext in self.ASSET_EXTENSIONS:
                     stats["assets"] += 1
                 else:
@@ -69,6 +69,9 @@ class DocsTranslator:
             glossary=self.glossary.get_terms()
         )
         
+        # System prompt depends only on languages and glossary, build it once
+        self._docs_system_prompt = None
+        
         self.logger = get_logger()
         
         # Stats
@@ -119,11 +122,11 @@ class DocsTranslator:
             return content
         
         # Translate each segment
-        translations = {}
+        translations = []
         for idx, text in segments:
             translated = self._translate_text(text)
             if translated:
-                translations[idx] = translated
+                translations.append((idx, translated))
         
         # Update blocks with translations
         blocks = parser.update_translated_text(blocks, translations)
@@ -191,7 +194,17 @@ class DocsTranslator:
             return None
     
     def _build_docs_system_prompt(self) -> str:
-        """Build system prompt for documentation translation."""
+        """Build system prompt for documentation translation.
+        
+        The prompt is cached on the instance, so every file translated by
+        this DocsTranslator reuses the same glossary section.
+        """
+        if self._docs_system_prompt is None:
+            self._docs_system_prompt = self._render_docs_system_prompt()
+        return self._docs_system_prompt
+    
+    def _render_docs_system_prompt(self) -> str:
+        """Render the documentation system prompt including glossary terms."""
         glossary_section = ""
         if self.glossary:
             terms = self.glossary.get_terms()
@@ -257,6 +270,13 @@ IMPORTANT:
         # Copy assets
         scanner.copy_assets()
         
+        # Hash sources up front in parallel
+        changed = {}
+        if not force:
+            changed = manifest.batch_is_changed(
+                (doc_file.relative_path, doc_file.source_path) for doc_file in files
+            )
+        
         # Translate files
         total = len(files)
         
@@ -269,7 +289,7 @@ IMPORTANT:
                     on_progress(pbar.n + 1, total, filename)
                 
                 # Check if file needs translation
-                if not force and not manifest.is_changed(doc_file.relative_path, doc_file.source_path):
+                if not force and not changed[doc_file.relative_path]:
                     self.logger.debug(f"Skipping unchanged: {doc_file.relative_path}")
                     self.stats["files_cached"] += 1
                     pbar.update(1)
@@ -284,7 +304,8 @@ IMPORTANT:
                         manifest.update(
                             doc_file.relative_path,
                             doc_file.source_hash,
-                            doc_file.output_path
+                            doc_file.output_path,
+                            doc_file.source_stat
                         )
                         self.stats["files_translated"] += 1
                     else:
@@ -1,6 +1,7 @@
 """DocxTranslator - Main translation orchestrator with advanced features."""
 
 import os
+import asyncio
 from pathlib import Path
 from typing import Optional
 
@@ -55,6 +56,11 @@ class DocxTranslator:
         glossary_file: Optional[str] = None,
         review_mode: bool = False,
         auto_resume: bool = True,
+        rate_limiter=None,
+        # Shared resources (reused across files in batch mode)
+        client=None,
+        glossary_loader: Optional[GlossaryLoader] = None,
+        cache: Optional[TranslationCache] = None,
     ):
         """
         Initialize DocxTranslator
@@ -79,6 +85,10 @@ class DocxTranslator:
             glossary_file: Path to glossary YAML file
             review_mode: Generate review HTML file
             auto_resume: Auto-resume from checkpoint
+            rate_limiter: Shared AsyncRateLimiter for all LLM requests (optional)
+            client: Pre-built LLM client to reuse instead of creating one
+            glossary_loader: Pre-loaded GlossaryLoader to reuse
+            cache: Shared TranslationCache to reuse
         """
         self.input_file = input_file
         self.output_dir = output_dir
@@ -95,6 +105,8 @@ class DocxTranslator:
         self.glossary_file = glossary_file
         self.review_mode = review_mode
         self.auto_resume = auto_resume
+        self._shared_glossary = glossary_loader
+        self._shared_cache = cache
         
         self.logger = get_logger()
         
@@ -114,6 +126,7 @@ class DocxTranslator:
         # Derive filenames
         file_name = os.path.splitext(os.path.basename(input_file))[0]
         self.checkpoint_file = os.path.join(output_dir, f"{file_name}_checkpoint.json")
+        self.checkpoint_db = os.path.join(output_dir, f"{file_name}_checkpoint.db")
         self.output_file = os.path.join(output_dir, f"{file_name}_translated.docx")
         self.cache_file = os.path.join(output_dir, ".translatex_cache.json")
         self.review_file = os.path.join(output_dir, f"{file_name}_review.html")
@@ -135,6 +148,8 @@ class DocxTranslator:
             cache=self.cache,
             context_window=self.context,
             glossary=self.glossary.get_terms() if self.glossary else None,
+            rate_limiter=rate_limiter,
+            client=client,
         )
         self.injector = Injector(self.input_file, self.checkpoint_file, self.output_file)
     
@@ -161,7 +176,7 @@ class DocxTranslator:
     def _init_advanced_features(self):
         """Initialize advanced feature components."""
         # Translation cache
-        self.cache = TranslationCache(
+        self.cache = self._shared_cache or TranslationCache(
             cache_file=self.cache_file,
             enabled=self.cache_enabled
         )
@@ -169,10 +184,10 @@ class DocxTranslator:
         self.context = ContextWindow(window_size=self.context_window_size)
         
         # Glossary
-        self.glossary = GlossaryLoader(glossary_file=self.glossary_file)
+        self.glossary = self._shared_glossary or GlossaryLoader(glossary_file=self.glossary_file)
         
-        # Checkpoint manager
-        self.checkpoint_manager = CheckpointManager(self.checkpoint_file)
+        # Checkpoint manager (SQLite; the JSON checkpoint_file is the worker hand-off)
+        self.checkpoint_manager = CheckpointManager(self.checkpoint_db)
         
         # Review generator
         self.review_generator = ReviewGenerator(self.review_file) if self.review_mode else None
@@ -210,16 +225,23 @@ class DocxTranslator:
     async def atranslate(self) -> str:
         """Run the entire translation pipeline asynchronously.
         
+        Extraction and injection are blocking python-docx work, so they run
+        in worker threads to keep the event loop free for other API calls.
+        
         Returns:
             Path to output file
         """
-        self.extract()
+        await asyncio.to_thread(self.extract)
         await self.translator._translate_all()
-        self.inject()
+        await asyncio.to_thread(self.inject)
         
         if self.review_mode and self.review_generator:
             self._generate_review()
         
+        if self.checkpoint_manager.exists():
+            self.checkpoint_manager.clear()
+            self.logger.info("Checkpoint cleared after successful translation")
+        
         return self.get_output_path()
 
     def extract(self):
@@ -1,51 +1,297 @@
 """Translation caching for TranslateX."""
 
-import json
-import hashlib
+import os
+import mmap
+import bisect
+import struct
+import tempfile
+from array import array
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
+import orjson
+import xxhash
+
 from .exceptions import CacheError
 
 
 class TranslationCache:
-    """Cache for storing and retrieving translations."""
+    """Cache for storing and retrieving translations.
+    
+    On disk the cache is two files derived from ``cache_file``:
+    
+    - ``.dat``: append-only records (uint64 key, uint32 length, orjson entry)
+    - ``.idx``: header, sorted uint64 keys, then the matching ``.dat`` offsets
+    
+    Both are memory-mapped on load; ``get`` binary-searches the key block and
+    decodes only the entry it needs, so startup cost does not grow with the
+    cache. Records appended after the last index build (the tail) are kept
+    in ``self.cache`` and folded into a new index once there are
+    ``REINDEX_TAIL`` of them.
+    
+    A JSON cache from older releases (``cache_file`` itself, keyed by
+    SHA-256) is imported once, re-keyed with xxh3, and then removed.
+    """
+    
+    # Bump when the key hash or .idx/.dat layout changes; such stores are
+    # discarded. The SHA-256 JSON cache is re-keyed by _import_legacy instead.
+    CACHE_VERSION = 3
+    
+    _IDX_MAGIC = b"TXCI"
+    _IDX_HEADER = struct.Struct("=4sIQQ")  # magic, version, count, indexed .dat bytes
+    _RECORD = struct.Struct("=QI")  # key, payload length
+    
+    # Rebuild the index once this many records sit in the unindexed tail
+    REINDEX_TAIL = 1024
+    
+    # Bloom prefilter for caches with many entries: at least 10 bits per key
+    # and 7 probes (~1% false positives), rebuilt at twice the size when full
+    BLOOM_MIN_ENTRIES = 50_000
+    BLOOM_BITS_PER_KEY = 10
+    BLOOM_PROBES = 7
     
     def __init__(self, cache_file: str = ".translatex_cache.json", enabled: bool = True):
         self.cache_file = cache_file
         self.enabled = enabled
-        self.cache: dict = {}
+        self.index_file = str(Path(cache_file).with_suffix(".idx"))
+        self.data_file = str(Path(cache_file).with_suffix(".dat"))
+        self.cache: dict = {}  # Tail entries, not yet in the index
+        self._tail_offsets: dict = {}
+        self._idx_map: Optional[mmap.mmap] = None
+        self._dat_map: Optional[mmap.mmap] = None
+        self._idx_view: Optional[memoryview] = None
+        self._keys: Optional[memoryview] = None
+        self._offsets: Optional[memoryview] = None
+        self._indexed_end = 0
+        self._count = 0
+        self._bloom: Optional[bytearray] = None
+        self._bloom_mask = 0
+        self._bloom_capacity = 0
         self._load()
+        if self._count >= self.BLOOM_MIN_ENTRIES:
+            self._build_bloom()
+    
+    def _hash(self, text: str) -> int:
+        """Generate xxh3-64 hash key for text (non-cryptographic, lookup only)."""
+        return xxhash.xxh3_64_intdigest(text.encode("utf-8"))
+    
+    def _build_bloom(self):
+        """Build the Bloom prefilter from all current keys, sized for twice as many."""
+        self._bloom_capacity = 2 * self._count
+        bits = 1 << max(3, (self._bloom_capacity * self.BLOOM_BITS_PER_KEY - 1).bit_length())
+        self._bloom = bytearray(bits // 8)
+        self._bloom_mask = bits - 1
+        for key in self._keys or ():
+            self._bloom_add(key)
+        for key in self.cache:
+            self._bloom_add(key)
+    
+    def _bloom_bits(self, key: int) -> list:
+        """Probe positions by double hashing the two 32-bit halves of the xxh3 key."""
+        mask = self._bloom_mask
+        low, step = key & 0xFFFFFFFF, (key >> 32) | 1
+        return [(low + i * step) & mask for i in range(self.BLOOM_PROBES)]
+    
+    def _bloom_add(self, key: int):
+        """Set every probe bit for key."""
+        bloom = self._bloom
+        for bit in self._bloom_bits(key):
+            bloom[bit >> 3] |= 1 << (bit & 7)
     
-    def _hash(self, text: str) -> str:
-        """Generate SHA256 hash key for text."""
-        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+    def _bloom_may_contain(self, key: int) -> bool:
+        """False means the key is definitely not cached."""
+        bloom = self._bloom
+        return all(bloom[bit >> 3] & (1 << (bit & 7)) for bit in self._bloom_bits(key))
     
     def _load(self):
-        """Load cache from file."""
+        """Map the index and data files and read the unindexed tail."""
         if not self.enabled:
             return
         
-        path = Path(self.cache_file)
-        if path.exists():
+        try:
+            self._import_legacy()
+            self._map_index()
+            self._read_tail()
+        except (OSError, ValueError, struct.error, orjson.JSONDecodeError):
+            # Cache corrupted or from an older version, start fresh
+            self._reset()
+            self._remove_files()
+            return
+        
+        if len(self.cache) >= self.REINDEX_TAIL:
+            self._reindex()
+    
+    def _import_legacy(self):
+        """Convert a legacy JSON cache into data file records, then delete it."""
+        legacy = Path(self.cache_file)
+        if (
+            str(legacy) in (self.index_file, self.data_file)
+            or os.path.exists(self.index_file)
+            or os.path.exists(self.data_file)
+            or not legacy.is_file()
+        ):
+            return
+        
+        try:
+            entries = orjson.loads(legacy.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            entries = {}
+        
+        records = []
+        for entry in entries.values() if isinstance(entries, dict) else ():
+            if not isinstance(entry, dict) or not isinstance(entry.get("source"), str):
+                continue
+            payload = orjson.dumps(entry)
+            records.append(self._RECORD.pack(self._hash(entry["source"]), len(payload)) + payload)
+        
+        if records:
+            # Written as a tail; _load folds it into an index as usual
+            directory = os.path.dirname(os.path.abspath(self.data_file))
+            tmp = tempfile.NamedTemporaryFile("wb", dir=directory, suffix=".tmp", delete=False)
             try:
-                with open(path, "r", encoding="utf-8") as f:
-                    self.cache = json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                # Cache corrupted, start fresh
-                self.cache = {}
-    
-    def _save(self):
-        """Save cache to file."""
-        if not self.enabled:
+                with tmp:
+                    tmp.write(b"".join(records))
+                os.replace(tmp.name, self.data_file)
+            except OSError:
+                Path(tmp.name).unlink(missing_ok=True)
+                raise
+        legacy.unlink()
+    
+    def _map_index(self):
+        """Memory-map the sorted index and the indexed part of the data file."""
+        try:
+            f = open(self.index_file, "rb")
+        except FileNotFoundError:
+            return
+        
+        header = self._IDX_HEADER
+        with f:
+            size = os.fstat(f.fileno()).st_size
+            if size < header.size:
+                raise ValueError("Truncated cache index")
+            self._idx_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        magic, version, count, indexed_end = header.unpack_from(self._idx_map)
+        if magic != self._IDX_MAGIC or version != self.CACHE_VERSION:
+            raise ValueError("Unsupported cache index")
+        if size != header.size + 16 * count:
+            raise ValueError("Truncated cache index")
+        
+        self._idx_view = memoryview(self._idx_map)[header.size:].cast("Q")
+        self._keys = self._idx_view[:count]
+        self._offsets = self._idx_view[count:]
+        self._indexed_end = indexed_end
+        self._count = count
+        
+        if indexed_end:
+            with open(self.data_file, "rb") as f:
+                self._dat_map = mmap.mmap(f.fileno(), indexed_end, access=mmap.ACCESS_READ)
+    
+    def _read_tail(self):
+        """Load records appended to the data file after the last index build."""
+        try:
+            f = open(self.data_file, "rb")
+        except FileNotFoundError:
             return
         
+        record = self._RECORD
+        with f:
+            f.seek(self._indexed_end)
+            tail = f.read()
+        
+        pos = 0
+        while pos < len(tail):
+            if len(tail) - pos < record.size:
+                break
+            key, length = record.unpack_from(tail, pos)
+            start = pos + record.size
+            if start + length > len(tail):
+                break
+            if key not in self.cache and self._indexed(key) < 0:
+                self._count += 1
+            self.cache[key] = orjson.loads(tail[start:start + length])
+            self._tail_offsets[key] = self._indexed_end + pos
+            pos = start + length
+        
+        if pos < len(tail):
+            # Torn final record from a crash: drop it so appends stay aligned
+            os.truncate(self.data_file, self._indexed_end + pos)
+    
+    def _indexed(self, key: int) -> int:
+        """Return the position of key in the index, or -1."""
+        keys = self._keys
+        if not keys:
+            return -1
+        i = bisect.bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            return i
+        return -1
+    
+    def _lookup(self, key: int) -> Optional[dict]:
+        """Decode a single indexed entry straight from the mapped data file."""
+        i = self._indexed(key)
+        if i < 0:
+            return None
+        offset = self._offsets[i]
+        _, length = self._RECORD.unpack_from(self._dat_map, offset)
+        start = offset + self._RECORD.size
+        return orjson.loads(self._dat_map[start:start + length])
+    
+    def _reindex(self):
+        """Fold the tail into a new sorted index (written atomically)."""
+        merged = dict(zip(self._keys, self._offsets)) if self._keys else {}
+        merged.update(self._tail_offsets)
+        keys = array("Q", sorted(merged))
+        offsets = array("Q", (merged[key] for key in keys))
+        data_end = os.path.getsize(self.data_file)
+        payload = (
+            self._IDX_HEADER.pack(self._IDX_MAGIC, self.CACHE_VERSION, len(keys), data_end)
+            + keys.tobytes()
+            + offsets.tobytes()
+        )
+        
+        # Maps must be closed before the index is replaced (Windows)
+        self._unmap()
+        directory = os.path.dirname(os.path.abspath(self.index_file))
+        tmp = tempfile.NamedTemporaryFile("wb", dir=directory, suffix=".tmp", delete=False)
         try:
-            with open(self.cache_file, "w", encoding="utf-8") as f:
-                json.dump(self.cache, f, ensure_ascii=False, indent=2)
-        except IOError as e:
-            raise CacheError(f"Failed to save cache: {e}")
+            with tmp:
+                tmp.write(payload)
+            os.replace(tmp.name, self.index_file)
+        except OSError as e:
+            Path(tmp.name).unlink(missing_ok=True)
+            raise CacheError(f"Failed to save cache index: {e}")
+        
+        self.cache = {}
+        self._tail_offsets = {}
+        self._map_index()
+    
+    def _unmap(self):
+        """Release index views and close both memory maps."""
+        for view in (self._keys, self._offsets, self._idx_view):
+            if view is not None:
+                view.release()
+        self._keys = self._offsets = self._idx_view = None
+        for mm in (self._idx_map, self._dat_map):
+            if mm is not None:
+                mm.close()
+        self._idx_map = self._dat_map = None
+        self._indexed_end = 0
+    
+    def _reset(self):
+        """Drop all in-memory state."""
+        self._unmap()
+        self.cache = {}
+        self._tail_offsets = {}
+        self._count = 0
+        self._bloom = None
+        self._bloom_capacity = 0
+    
+    def _remove_files(self):
+        """Delete the index and data files."""
+        for path in (self.index_file, self.data_file):
+            Path(path).unlink(missing_ok=True)
     
     def get(self, source_text: str) -> Optional[str]:
         """Get cached translation by hash. Returns None if not found."""
@@ -53,31 +299,53 @@ class TranslationCache:
             return None
         
         key = self._hash(source_text)
+        if self._bloom is not None and not self._bloom_may_contain(key):
+            return None
         entry = self.cache.get(key)
-        if entry:
+        if entry is None:
+            entry = self._lookup(key)
+        # The key is a 64-bit hash: check the stored source to rule out a collision
+        if entry and entry.get("source") == source_text:
             return entry.get("translated")
         return None
     
     def set(self, source_text: str, translated: str):
-        """Store translation in cache."""
+        """Store translation in cache (one record appended to the data file)."""
         if not self.enabled:
             return
         
         key = self._hash(source_text)
-        self.cache[key] = {
+        entry = {
             "source": source_text,
             "translated": translated,
             "timestamp": datetime.now().isoformat()
         }
-        self._save()
+        payload = orjson.dumps(entry)
+        try:
+            with open(self.data_file, "ab") as f:
+                offset = f.tell()
+                f.write(self._RECORD.pack(key, len(payload)) + payload)
+        except OSError as e:
+            raise CacheError(f"Failed to save cache: {e}")
+        
+        if key not in self.cache and self._indexed(key) < 0:
+            self._count += 1
+        self.cache[key] = entry
+        self._tail_offsets[key] = offset
+        if self._bloom is not None:
+            self._bloom_add(key)
+        if self._count >= self.BLOOM_MIN_ENTRIES and self._count > self._bloom_capacity:
+            # Crossed the threshold, or the filter is full: rebuild at the new size
+            self._build_bloom()
+        
+        if len(self.cache) >= self.REINDEX_TAIL:
+            self._reindex()
     
     def clear(self):
         """Clear all cached translations."""
-        self.cache = {}
-        path = Path(self.cache_file)
-        if path.exists():
-            path.unlink()
+        self._reset()
+        self._remove_files()
     
     def size(self) -> int:
         """Return number of cached entries."""
-        return len(self.cache)
+        return self._count
@@ -1,40 +1,144 @@
 """Checkpoint management for resume functionality."""
 
-import json
+import sqlite3
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
+import xxhash
+
 from .exceptions import CheckpointError
 
 
 class CheckpointManager:
-    """Manages translation checkpoints for resume functionality."""
+    """Manages translation checkpoints for resume functionality.
+    
+    Progress is stored in a SQLite database in WAL mode: each translated
+    segment is one row of ``translations(idx, content_id)``, so
+    ``save_incremental`` is a single upsert instead of a rewrite of the
+    whole checkpoint. Translation text is deduplicated in ``contents``:
+    rows are looked up by an xxh3-64 index plus an exact text comparison
+    (so a hash collision only costs a second row), and repeated
+    translations (empty strings, numbers, boilerplate) are stored once and
+    share one ``str`` after ``load``. Run metadata lives in a ``meta`` table.
+    """
+    
+    # Bump when the schema changes; older checkpoints are dropped on open
+    SCHEMA_VERSION = 2
+    
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);"
+        "CREATE TABLE IF NOT EXISTS contents (id INTEGER PRIMARY KEY, hash INTEGER NOT NULL, text TEXT NOT NULL);"
+        "CREATE INDEX IF NOT EXISTS contents_hash ON contents (hash);"
+        "CREATE TABLE IF NOT EXISTS translations (idx INTEGER PRIMARY KEY, content_id INTEGER);"
+    )
+    
+    _DROP_SCHEMA = (
+        "DROP TABLE IF EXISTS meta;"
+        "DROP TABLE IF EXISTS contents;"
+        "DROP TABLE IF EXISTS translations;"
+    )
     
     def __init__(self, checkpoint_file: str):
         self.checkpoint_file = checkpoint_file
+        self._conn: Optional[sqlite3.Connection] = None
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open (once) the checkpoint database and ensure the schema exists."""
+        if self._conn is None:
+            # DocxTranslator may create the manager in a worker thread
+            conn = sqlite3.connect(self.checkpoint_file, check_same_thread=False)
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                # WAL + NORMAL: commits don't fsync, only WAL checkpoints do
+                conn.execute("PRAGMA synchronous=NORMAL")
+                (version,) = conn.execute("PRAGMA user_version").fetchone()
+                if version != self.SCHEMA_VERSION:
+                    # Old layout: a checkpoint is only resume state, start fresh
+                    conn.executescript(self._DROP_SCHEMA)
+                    conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+                conn.executescript(self._SCHEMA)
+            except sqlite3.Error:
+                conn.close()
+                raise
+            self._conn = conn
+        return self._conn
+    
+    def close(self):
+        """Close the database connection (checkpoints and removes the WAL)."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
     
     def save(self, segments: list, translated_indices: set, translations: dict = None):
         """Save current progress to checkpoint file.
         
+        Replaces all stored rows with the given snapshot in one transaction.
+        
         Args:
             segments: List of all segments
             translated_indices: Set of indices that have been translated
             translations: Dict mapping index to translated text
         """
+        translations = translations or {}
+        content_ids = {}  # text -> id: keyed on the full text, so no collisions
+        idx_map = []
+        for i in set(translated_indices) | translations.keys():
+            text = translations.get(i)
+            content_id = None
+            if text is not None:
+                content_id = content_ids.setdefault(text, len(content_ids) + 1)
+            idx_map.append((i, content_id))
+        
         try:
-            data = {
-                "timestamp": datetime.now().isoformat(),
-                "total_segments": len(segments),
-                "translated_indices": list(translated_indices),
-                "translations": translations or {},
-                "segments_hash": self._hash_segments(segments)
-            }
-            with open(self.checkpoint_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-        except IOError as e:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                    [
+                        ("timestamp", datetime.now().isoformat()),
+                        ("total_segments", str(len(segments))),
+                        # Stored as text: xxh3-64 digests overflow SQLite's signed INTEGER
+                        ("segments_hash", str(self._hash_segments(segments))),
+                    ],
+                )
+                conn.execute("DELETE FROM translations")
+                conn.execute("DELETE FROM contents")
+                conn.executemany(
+                    "INSERT INTO contents (id, hash, text) VALUES (?, ?, ?)",
+                    [(content_id, self._content_hash(text), text) for text, content_id in content_ids.items()],
+                )
+                conn.executemany(
+                    "INSERT INTO translations (idx, content_id) VALUES (?, ?)", idx_map
+                )
+        except sqlite3.Error as e:
             raise CheckpointError(f"Failed to save checkpoint: {e}")
     
+    def save_incremental(self, index: int, translation: str):
+        """Record a single translated segment.
+        
+        Args:
+            index: Segment index
+            translation: Translated text
+        """
+        try:
+            content_hash = self._content_hash(translation)
+            conn = self._connect()
+            with conn:
+                # Reuse a row only if its text matches exactly, not just its hash
+                conn.execute(
+                    "INSERT INTO contents (hash, text) SELECT ?, ? WHERE NOT EXISTS "
+                    "(SELECT 1 FROM contents WHERE hash = ? AND text = ?)",
+                    (content_hash, translation, content_hash, translation),
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO translations (idx, content_id) "
+                    "SELECT ?, id FROM contents WHERE hash = ? AND text = ?",
+                    (index, content_hash, translation),
+                )
+        except sqlite3.Error as e:
+            raise CheckpointError(f"Failed to update checkpoint: {e}")
+    
     def load(self) -> tuple[set, dict]:
         """Load existing checkpoint.
         
@@ -45,26 +149,34 @@ class CheckpointManager:
             return set(), {}
         
         try:
-            with open(self.checkpoint_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            
-            translated_indices = set(data.get("translated_indices", []))
-            translations = data.get("translations", {})
-            # Convert string keys back to int
-            translations = {int(k): v for k, v in translations.items()}
-            return translated_indices, translations
-        except (json.JSONDecodeError, IOError) as e:
+            conn = self._connect()
+            content_map = dict(conn.execute("SELECT id, text FROM contents"))
+            rows = conn.execute("SELECT idx, content_id FROM translations").fetchall()
+        except sqlite3.Error as e:
             raise CheckpointError(f"Failed to load checkpoint: {e}")
+        
+        # Rehydrate by reference: equal translations share one string object
+        translated_indices = {idx for idx, _ in rows}
+        translations = {
+            idx: content_map[content_id]
+            for idx, content_id in rows
+            if content_id in content_map
+        }
+        return translated_indices, translations
+    
+    def _get_meta(self) -> dict:
+        """Read the meta table into a dict."""
+        return dict(self._connect().execute("SELECT key, value FROM meta"))
     
     def exists(self) -> bool:
         """Check if checkpoint file exists."""
         return Path(self.checkpoint_file).exists()
     
     def clear(self):
-        """Remove checkpoint file."""
-        path = Path(self.checkpoint_file)
-        if path.exists():
-            path.unlink()
+        """Remove checkpoint database and its WAL/shared-memory files."""
+        self.close()
+        for suffix in ("", "-wal", "-shm"):
+            Path(self.checkpoint_file + suffix).unlink(missing_ok=True)
     
     def get_progress(self) -> Optional[dict]:
         """Get checkpoint progress info without full load."""
@@ -72,21 +184,32 @@ class CheckpointManager:
             return None
         
         try:
-            with open(self.checkpoint_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            meta = self._get_meta()
+            (completed,) = self._connect().execute("SELECT COUNT(*) FROM translations").fetchone()
             return {
-                "timestamp": data.get("timestamp"),
-                "total": data.get("total_segments", 0),
-                "completed": len(data.get("translated_indices", []))
+                "timestamp": meta.get("timestamp"),
+                "total": int(meta.get("total_segments", 0)),
+                "completed": completed
             }
-        except (json.JSONDecodeError, IOError):
+        except sqlite3.Error:
             return None
     
-    def _hash_segments(self, segments: list) -> str:
-        """Create hash of segments for validation."""
-        import hashlib
-        content = "".join(str(s) for s in segments)
-        return hashlib.md5(content.encode()).hexdigest()
+    @staticmethod
+    def _content_hash(text: str) -> int:
+        """xxh3-64 of a translation, as a signed 64-bit SQLite INTEGER (lookup index only)."""
+        digest = xxhash.xxh3_64_intdigest(text.encode("utf-8"))
+        return digest - (1 << 64) if digest >= 1 << 63 else digest
+    
+    def _hash_segments(self, segments: list) -> int:
+        """Create a single xxh3-64 digest of the segment sequence for validation.
+        
+        Segments are NUL-separated so ["ab", "c"] and ["a", "bc"] differ.
+        """
+        hasher = xxhash.xxh3_64()
+        for segment in segments:
+            hasher.update(str(segment).encode("utf-8"))
+            hasher.update(b"\0")
+        return hasher.intdigest()
     
     def validate(self, segments: list) -> bool:
         """Validate checkpoint matches current segments."""
@@ -94,11 +217,8 @@ class CheckpointManager:
             return False
         
         try:
-            with open(self.checkpoint_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            
-            stored_hash = data.get("segments_hash")
-            current_hash = self._hash_segments(segments)
+            stored_hash = self._get_meta().get("segments_hash")
+            current_hash = str(self._hash_segments(segments))
             return stored_hash == current_hash
-        except (json.JSONDecodeError, IOError):
+        except sqlite3.Error:
             return False
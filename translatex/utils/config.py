@@ -35,6 +35,7 @@ class TranslateXConfig:
     
     # Advanced features - Batch Processing
     batch_enabled: bool = True
+    batch_concurrency: int = 2
     
     # Advanced features - Cache
     cache_enabled: bool = True
@@ -1,11 +1,18 @@
 """Context window for coherent translations."""
 
-from collections import deque
+import sys
 from typing import List, Optional
 
 
 class ContextWindow:
-    """Maintains a sliding window of previous segments for context."""
+    """Maintains a sliding window of previous segments for context.
+    
+    Segments are stored in a fixed-size ring buffer: ``add`` overwrites the
+    oldest slot in O(1) and readers rebuild the order from the head index.
+    """
+    
+    # Short segments (labels, numbers, headings) repeat often; intern them
+    INTERN_MAX_LEN = 64
     
     def __init__(self, window_size: int = 0):
         """Initialize context window.
@@ -14,12 +21,21 @@ class ContextWindow:
             window_size: Number of previous segments to keep (0 = disabled)
         """
         self.window_size = window_size
-        self.history: deque = deque(maxlen=window_size if window_size > 0 else 1)
+        self._buf: List[Optional[str]] = [None] * max(window_size, 0)
+        self._head = 0  # Next slot to write
+        self._count = 0
+        self._formatted_cache: Optional[str] = None
     
     def add(self, segment: str):
         """Add a translated segment to history."""
         if self.window_size > 0:
-            self.history.append(segment)
+            if len(segment) <= self.INTERN_MAX_LEN:
+                segment = sys.intern(segment)
+            self._buf[self._head] = segment
+            self._head = (self._head + 1) % self.window_size
+            if self._count < self.window_size:
+                self._count += 1
+            self._formatted_cache = None
     
     def get_context(self) -> Optional[str]:
         """Get context string for prompt.
@@ -27,40 +43,46 @@ class ContextWindow:
         Returns:
             Formatted context string or None if disabled/empty
         """
-        if self.window_size == 0 or not self.history:
+        if self.window_size == 0 or not self._count:
             return None
         
-        return "\n".join(self.history)
+        return "\n".join(self.get_context_segments())
     
     def get_context_segments(self) -> List[str]:
-        """Get list of context segments."""
+        """Get list of context segments (oldest first)."""
         if self.window_size == 0:
             return []
-        return list(self.history)
+        if self._count < self.window_size:
+            return self._buf[:self._count]
+        return self._buf[self._head:] + self._buf[:self._head]
     
     def clear(self):
         """Clear context history."""
-        self.history.clear()
+        self._buf = [None] * max(self.window_size, 0)
+        self._head = 0
+        self._count = 0
+        self._formatted_cache = None
     
     def size(self) -> int:
         """Return current number of segments in context."""
-        return len(self.history)
+        return self._count
     
     def format_for_prompt(self) -> str:
         """Format context for inclusion in translation prompt.
         
+        The result is cached until the window changes via add() or clear().
+        
         Returns:
             Formatted string with context marked as reference only
         """
-        if self.window_size == 0 or not self.history:
+        if self.window_size == 0 or not self._count:
             return ""
         
-        context_text = self.get_context()
-        return f"""
-[CONTEXT - For reference only, do not translate this section]
-Previous translated segments:
----
-{context_text}
----
-[END CONTEXT]
-"""
+        if self._formatted_cache is None:
+            self._formatted_cache = "".join([
+                "\n[CONTEXT - For reference only, do not translate this section]\n"
+                "Previous translated segments:\n---\n",
+                self.get_context(),
+                "\n---\n[END CONTEXT]\n",
+            ])
+        return self._formatted_cache
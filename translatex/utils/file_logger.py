@@ -51,7 +51,8 @@ class FileLogger:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 self.log_file = str(Path(output_dir) / f"translatex_{timestamp}.log")
             
-            self._file_handler = logging.FileHandler(self.log_file, encoding="utf-8")
+            # delay=True: the file is only created when the first record is written
+            self._file_handler = logging.FileHandler(self.log_file, encoding="utf-8", delay=True)
             self._file_handler.setFormatter(formatter)
             self.logger.addHandler(self._file_handler)
         
@@ -72,10 +73,14 @@ class FileLogger:
     
     def log_summary(self, stats: dict):
         """Log translation summary statistics - file only, no console."""
-        # Only log to file, not console (to keep CLI clean)
+        # Only log to file, not console (to keep CLI clean): hand one record
+        # straight to the file handler, whatever the logger's level
         if self._file_handler:
-            for key, value in stats.items():
-                self._file_handler.stream.write(f"{key}: {value}\n")
+            lines = ["Summary"] + [f"{key}: {value}" for key, value in stats.items()]
+            record = self.logger.makeRecord(
+                self.logger.name, logging.INFO, __file__, 0, "\n".join(lines), None, None
+            )
+            self._file_handler.handle(record)
             self._file_handler.flush()
     
     def debug(self, msg: str):
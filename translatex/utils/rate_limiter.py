@@ -56,6 +56,37 @@ class RateLimiter:
         return asyncio.Semaphore(self.max_concurrent)
 
 
+class AsyncRateLimiter:
+    """Enforce a minimum interval between requests shared by many workers.
+    
+    Each caller reserves the next free time slot under the lock and then
+    sleeps outside of it, so concurrent translators are spaced out evenly
+    instead of bursting into 429 errors.
+    """
+    
+    def __init__(self, rps: float):
+        """
+        Args:
+            rps: Maximum requests per second (<= 0 disables limiting)
+        """
+        self.interval = 1.0 / rps if rps > 0 else 0.0
+        self._next_ts = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait until the next request slot is available"""
+        if self.interval <= 0:
+            return
+        
+        async with self._lock:
+            now = time.monotonic()
+            wait_time = self._next_ts - now
+            self._next_ts = max(now, self._next_ts) + self.interval
+        
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+
 async def retry_with_backoff(
     func,
     max_retries: int = 3,
@@ -34,6 +34,10 @@ class RetryHandler:
         self.max_delay = max_delay
         self.exponential_base = exponential_base
     
+    def _base_delay(self, attempt: int) -> float:
+        """Exponential backoff delay for attempt, capped, without jitter."""
+        return min(self.base_delay * (self.exponential_base ** attempt), self.max_delay)
+    
     def calculate_delay(self, attempt: int, retry_after: int = None) -> float:
         """Calculate delay for given attempt using exponential backoff.
         
@@ -47,13 +51,9 @@ class RetryHandler:
         if retry_after:
             return min(retry_after, self.max_delay)
         
-        # Exponential backoff with jitter
-        delay = self.base_delay * (self.exponential_base ** attempt)
-        # Add jitter (0-25% of delay)
-        jitter = delay * random.uniform(0, 0.25)
-        delay = delay + jitter
-        
-        return min(delay, self.max_delay)
+        # Exponential backoff with jitter (0-25% of delay)
+        delay = self._base_delay(attempt)
+        return min(delay + delay * random.uniform(0, 0.25), self.max_delay)
     
     def execute(self, func: Callable[[], T], context: str = "") -> T:
         """Execute function with retry logic.
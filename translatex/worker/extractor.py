@@ -18,7 +18,7 @@ class Extractor:
     def __init__(self, input_file: str, checkpoint_file: str):
         self.input_file = input_file
         self.checkpoint_file = checkpoint_file
-        self.doc = Document(input_file)
+        self._doc = None  # Load lazily, release after extract()
         self.text_segments = []
         self.table_cell_segments = []
         self.chart_segments = []
@@ -30,6 +30,13 @@ class Extractor:
             'c': 'http://schemas.openxmlformats.org/drawingml/2006/chart',
         }
 
+    @property
+    def doc(self):
+        """Chỉ đọc DOCX khi thực sự cần dùng"""
+        if self._doc is None:
+            self._doc = Document(self.input_file)
+        return self._doc
+    
     def _has_smartart_or_chart(self, para: Paragraph):
         """Kiểm tra xem đoạn văn có chứa SmartArt hoặc Chart không"""
         para_elem = para._element
@@ -173,16 +180,11 @@ class Extractor:
         
         # Extract với progress bars
         self._extract_text_segments(self.doc.paragraphs)
-        
-        # Đếm tổng số cells trong tất cả các bảng
-        all_cells = []
-        for table in self.doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    for para in cell.paragraphs:
-                        all_cells.append((table, row, cell, para))
         self._extract_table_cell_segments(self.doc.tables)
         
+        # Giải phóng DOM của document, phần còn lại chỉ đọc XML trong ZIP
+        self._doc = None
+        
         # Lấy danh sách chart và SmartArt files
         try:
             with zipfile.ZipFile(self.input_file) as z:
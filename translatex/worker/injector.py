@@ -21,7 +21,7 @@ class Injector:
         self.input_file = input_file
         self.checkpoint_file = checkpoint_file
         self.output_file = output_file
-        self.doc = Document(input_file)
+        self._doc = None  # Load lazily when inject() runs
         self.logger = logging.getLogger(self.__class__.__name__)
         
         self.ns = {
@@ -29,6 +29,13 @@ class Injector:
             'c': 'http://schemas.openxmlformats.org/drawingml/2006/chart',
         }
     
+    @property
+    def doc(self):
+        """Chỉ đọc DOCX khi thực sự cần dùng"""
+        if self._doc is None:
+            self._doc = Document(self.input_file)
+        return self._doc
+    
     def _apply_runs(self, para: Paragraph, runs_list: list[RunInfo]):
         """Áp dụng danh sách runs vào paragraph"""
         for run_info in runs_list:
@@ -177,8 +184,9 @@ class Injector:
         self._inject_text_segments(checkpoint_data["text_segments"])
         self._inject_table_cell_segments(checkpoint_data["table_cell_segments"])
         
-        # Lưu trước khi inject chart/smartart
+        # Lưu trước khi inject chart/smartart, sau đó giải phóng DOM
         self.doc.save(self.output_file)
+        self._doc = None
         
         # Inject chart và SmartArt segments với progress bar
         self._inject_chart_and_smartart(
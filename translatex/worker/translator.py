@@ -17,7 +17,7 @@ logging.basicConfig(level=logging.WARNING)
 class Translator:
     """Dịch nội dung từ checkpoint file sử dụng LLM API với async (OpenAI hoặc OpenRouter)"""
     
-    def __init__(self, checkpoint_file: str, api_key: str, provider: str = "openai", model: str = "gpt-4o-mini", source_lang: str = "English", target_lang: str = "Vietnamese", max_chunk_size: int = 5000, max_concurrent: int = 100, cache=None, context_window=None, glossary: dict = None):
+    def __init__(self, checkpoint_file: str, api_key: str, provider: str = "openai", model: str = "gpt-4o-mini", source_lang: str = "English", target_lang: str = "Vietnamese", max_chunk_size: int = 5000, max_concurrent: int = 100, cache=None, context_window=None, glossary: dict = None, rate_limiter=None, client=None):
         """
         Khởi tạo Translator
         
@@ -33,6 +33,8 @@ class Translator:
             cache: TranslationCache instance (optional)
             context_window: ContextWindow instance (optional)
             glossary: Dict of glossary terms (optional)
+            rate_limiter: AsyncRateLimiter dùng chung giữa các translator (optional)
+            client: LLM client dùng chung, bỏ qua việc tạo client mới (optional)
         """
         self.checkpoint_file = checkpoint_file
         self.provider = provider
@@ -41,14 +43,19 @@ class Translator:
         self.cache = cache
         self.context_window = context_window
         self.glossary = glossary or {}
+        self.rate_limiter = rate_limiter
         
         # Stats tracking
         self.cache_hits = 0
         self.api_calls = 0
         
-        # Khởi tạo LLM client manager
-        self.client_manager = OpenAIClientManager(api_key=api_key, provider=provider)
-        self.client = self.client_manager.get_client()
+        # Khởi tạo LLM client manager (hoặc dùng lại client đã tạo sẵn)
+        if client is not None:
+            self.client_manager = None
+            self.client = client
+        else:
+            self.client_manager = OpenAIClientManager(api_key=api_key, provider=provider)
+            self.client = self.client_manager.get_client()
         
         # Load config
         self.model = model
@@ -112,13 +119,18 @@ class Translator:
         
         async with self.semaphore:
             base_delay = 2  # Base delay in seconds
+            max_delay = 60  # Upper bound for rate-limit backoff
             
             # Add pre-request delay to avoid rate limits (spread requests over time)
-            if self.request_delay > 0:
+            if self.rate_limiter is None and self.request_delay > 0:
                 await asyncio.sleep(self.request_delay)
             
             for attempt in range(max_retries):
                 try:
+                    # Shared limiter spaces out requests across all translators
+                    if self.rate_limiter is not None:
+                        await self.rate_limiter.acquire()
+                    
                     messages = self.prompt_builder.build_messages(text)
                     
                     response = await self.client.chat.completions.create(
@@ -154,7 +166,7 @@ class Translator:
                     # Check if rate limit error
                     if "429" in error_str or "rate" in error_str.lower() or "resource" in error_str.lower():
                         # Use longer delay for rate limits (silent retry)
-                        delay = max(base_delay * (2 ** attempt), self.request_delay * 2)
+                        delay = min(max(base_delay * (2 ** attempt), self.request_delay * 2), max_delay)
                         await asyncio.sleep(delay)
                         continue
                     
@@ -319,9 +331,10 @@ class Translator:
         
         return chunk
     
-    async def _translate_text_segments(self, text_segments: list[TextSegment], progress_callback=None):
+    async def _translate_text_segments(self, text_segments: list[TextSegment], progress_callback=None, chunks: list[list[TextSegment]] = None):
         """Dịch tất cả text segments (theo chunks) với async"""
-        chunks = self._chunk_text_segments(text_segments)
+        if chunks is None:
+            chunks = self._chunk_text_segments(text_segments)
         self.logger.info(f"Split {len(text_segments)} text segments into {len(chunks)} chunks")
         
         if self.sequential_mode:
@@ -517,8 +530,9 @@ class Translator:
         chart_segments = checkpoint_data.get("chart_segments", [])
         smartart_segments = checkpoint_data.get("smartart_segments", [])
 
-        if text_segments:
-            total_tasks += len(self._chunk_text_segments(text_segments))
+        # Chia chunks một lần, dùng lại cho cả đếm tasks và dịch
+        text_chunks = self._chunk_text_segments(text_segments) if text_segments else []
+        total_tasks += len(text_chunks)
         
         if table_cell_segments:
             total_tasks += len(self._group_table_cells_by_table(table_cell_segments))
@@ -538,7 +552,7 @@ class Translator:
             all_tasks = []
             
             if text_segments:
-                all_tasks.append(self._translate_text_segments(text_segments, progress_callback))
+                all_tasks.append(self._translate_text_segments(text_segments, progress_callback, text_chunks))
             
             if table_cell_segments:
                 all_tasks.append(self._translate_table_cell_segments(table_cell_segments, progress_callback))